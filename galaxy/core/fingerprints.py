@@ -0,0 +1,104 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import msgspec
+
+__all__ = ["EntityFingerprints"]
+
+
+class EntityFingerprints:
+    """Persistent store of the fingerprints of the entities successfully pushed to magneto.
+
+    Entities are identified by their `blueprintId` and `id`, and the fingerprint is a hash of the whole mapped entity.
+    It is used to skip pushing entities that did not change since the last run. Fingerprints older than `max_age`
+    seconds are ignored, so entities changed or deleted on the server side are eventually pushed again.
+
+    The store can be used from worker threads, one call at a time.
+    """
+
+    def __init__(self, path: Path | str, integration_id: str, max_age: float | None = None):
+        self.path = Path(path)
+        self.integration_id = integration_id
+        self.max_age = max_age
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entity_fingerprints ("
+            "integration_id TEXT NOT NULL, blueprint_id TEXT NOT NULL, entity_id TEXT NOT NULL, "
+            "fingerprint TEXT NOT NULL, recorded_at REAL NOT NULL DEFAULT 0, "
+            "PRIMARY KEY (integration_id, blueprint_id, entity_id))"
+        )
+        # Fingerprints of stores created before they had a record time are only used when they never expire
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(entity_fingerprints)")}
+        if "recorded_at" not in columns:
+            self._connection.execute("ALTER TABLE entity_fingerprints ADD COLUMN recorded_at REAL NOT NULL DEFAULT 0")
+        self._connection.commit()
+
+    def __enter__(self) -> "EntityFingerprints":
+        return self
+
+    def __exit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def fingerprint(entity: dict[str, Any]) -> str:
+        # Keys are sorted so the fingerprint does not depend on the order the entity properties were mapped
+        return hashlib.blake2b(msgspec.json.encode(entity, order="sorted"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _key(entity: dict[str, Any]) -> tuple[str, str] | None:
+        if not entity.get("id") or not entity.get("blueprintId"):
+            return None
+        return str(entity["blueprintId"]), str(entity["id"])
+
+    def filter_changed(self, entities: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the entities that are new or changed since their fingerprint was recorded."""
+        keys = {key for entity in entities if (key := self._key(entity)) is not None}
+        entity_ids = list({entity_id for _, entity_id in keys})
+        recorded_after = time.time() - self.max_age if self.max_age is not None else 0
+
+        fingerprints = {}
+        with self._lock:
+            # Query in batches to stay below the sqlite limit of variables per statement
+            for i in range(0, len(entity_ids), 500):
+                batch = entity_ids[i : i + 500]
+                rows = self._connection.execute(
+                    "SELECT blueprint_id, entity_id, fingerprint FROM entity_fingerprints "
+                    f"WHERE integration_id = ? AND recorded_at >= ? AND entity_id IN ({', '.join('?' * len(batch))})",
+                    (self.integration_id, recorded_after, *batch),
+                )
+                fingerprints.update({(blueprint_id, entity_id): fp for blueprint_id, entity_id, fp in rows})
+
+        return [
+            entity
+            for entity in entities
+            if (key := self._key(entity)) is None or fingerprints.get(key) != self.fingerprint(entity)
+        ]
+
+    def record(self, entities: Iterable[dict[str, Any]]) -> None:
+        """Record the fingerprints of entities that were successfully pushed."""
+        recorded_at = time.time()
+        rows = [
+            (self.integration_id, *key, self.fingerprint(entity), recorded_at)
+            for entity in entities
+            if (key := self._key(entity)) is not None
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entity_fingerprints "
+                "(integration_id, blueprint_id, entity_id, fingerprint, recorded_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
@@ -1,15 +1,18 @@
 import functools
 import importlib
+import inspect
 import json
 import logging
+import statistics
 import time
 import traceback
 from collections import OrderedDict
 from collections.abc import AsyncGenerator, Callable
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeAlias, TypeVar
 
 import anyio
+from magneto_api_client import TaskRead
 
 from galaxy.core.blueprints import collect_blueprints
 from galaxy.core.exceptions import (
@@ -19,21 +22,38 @@ from galaxy.core.exceptions import (
     IntegrationRunMethodError,
     IntegrationRunWarning,
 )
+from galaxy.core.fingerprints import EntityFingerprints
 from galaxy.core.logging import get_magneto_logs
-from galaxy.core.magneto import Magneto, TaskWithEntities, magneto_models
+from galaxy.core.magneto import Magneto, magneto_models
 from galaxy.core.mapper import Mapper
 from galaxy.core.models import Config
 from galaxy.core.resources import load_integration_resource
 from galaxy.core.utils import update_integration_config_entity
+from galaxy.utils.concurrency import run_in_thread, task_group_run_with_semaphore
+from galaxy.utils.serializers import json_deserialize, json_serialize
 
 __all__ = ["Integration", "import_and_instantiate_integration", "register", "run_integration"]
 
+# Bounds (in seconds) of the interval between status checks of each push task
+PUSH_TASKS_POLL_MIN_INTERVAL: float = 1
+PUSH_TASKS_POLL_MAX_INTERVAL: float = 30
+
+# Push task with the entities it upserts, serialized while waiting for the task as they are only needed to retry it or
+# record their fingerprints
+TaskWithSerializedEntities: TypeAlias = tuple[TaskRead, bytes]
+
+T = TypeVar("T")
+
 
 class Integration:
     def __init__(self, config: Config):
         self.config = config
         self.logger = logging.getLogger("galaxy")
-        self.mapper = Mapper(config.integration.type)
+        self.mapper = Mapper(
+            config.integration.type,
+            processes=config.integration.mapper_processes,
+            process_threshold=config.integration.mapper_process_threshold,
+        )
 
     @property
     def id_(self) -> str:
@@ -88,6 +108,7 @@ async def import_and_instantiate_integration(
 
 @instance_async_enter
 async def run_integration(instance: Integration, *, magneto_client: Magneto, logger: logging.Logger) -> bool:
+    entity_fingerprints: EntityFingerprints | None = None
     try:
         if not instance.is_dry_run:
             config_entity = await magneto_client.get_entity(instance.id_)
@@ -99,8 +120,20 @@ async def run_integration(instance: Integration, *, magneto_client: Magneto, log
 
         _ = await collect_blueprints(instance.config, magneto_client=magneto_client)
         await _upsert_automations(instance, magneto_client=magneto_client, logger=logger)
+
+        if instance.config.integration.entity_fingerprints_path and not instance.is_dry_run:
+            entity_fingerprints = EntityFingerprints(
+                instance.config.integration.entity_fingerprints_path,
+                integration_id=instance.id_,
+                max_age=instance.config.integration.entity_fingerprints_max_age_seconds,
+            )
+
         await run_integration_methods(
-            instance=instance, config_entity=config_entity, magneto_client=magneto_client, logger=logger
+            instance=instance,
+            config_entity=config_entity,
+            magneto_client=magneto_client,
+            logger=logger,
+            entity_fingerprints=entity_fingerprints,
         )
     except IntegrationRunWarning as e:
         if not instance.is_dry_run:
@@ -131,39 +164,100 @@ async def run_integration(instance: Integration, *, magneto_client: Magneto, log
 
         return True
     finally:
+        if entity_fingerprints is not None:
+            entity_fingerprints.close()
         get_magneto_logs(logger).flush()
 
 
 async def run_integration_methods(
-    instance: Integration, *, config_entity: dict[str, Any] | None, magneto_client: Magneto, logger: logging.Logger
+    instance: Integration,
+    *,
+    config_entity: dict[str, Any] | None,
+    magneto_client: Magneto,
+    logger: logging.Logger,
+    entity_fingerprints: EntityFingerprints | None = None,
 ) -> None:
     errors: list[Exception] = []
     warnings: list[Exception] = []
     entities_found = {}
-    tasks_entities: dict[str, TaskWithEntities] = {}
+    entities_unchanged = {}
+    tasks_created = {}
+    tasks_entities: dict[str, TaskWithSerializedEntities] = {}
+    tasks_created_at: dict[str, float] = {}
 
     method_logger_width = max(len(method.__name__) for method, _ in instance._methods)
 
+    # Window of push task creation requests in flight, shared by all the methods running concurrently
+    push_semaphore = anyio.Semaphore(instance.config.integration.push_tasks_max_concurrency)
+
     async def _run_integration_method_and_push_to_magneto(method: Callable) -> None:
         logger.info("%-*s | Executing method", method_logger_width, method.__name__)
 
+        method_entities_count = 0
+        method_unchanged_count = 0
+        method_tasks_count = 0
+
+        async def _push_entities(entities: list[dict[str, Any]]) -> None:
+            nonlocal method_tasks_count, method_unchanged_count
+
+            logger.debug("%-*s | Results: %r", method_logger_width, method.__name__, entities)
+            if instance.is_dry_run:
+                return
+
+            if entity_fingerprints is not None:
+                changed_entities = await run_in_thread(entity_fingerprints.filter_changed, entities)
+                method_unchanged_count += len(entities) - len(changed_entities)
+                entities = changed_entities
+                if not entities:
+                    return
+
+            created_tasks = await magneto_client.upsert_entities_bulk_chunks(entities)
+            created_at = time.monotonic()
+            method_tasks_count += len(created_tasks)
+            # Entities are only kept around if they may be needed to retry failed push tasks. They are serialized,
+            # which takes far less memory than the mapped dicts but still grows with the number of entities pushed.
+            if instance.config.integration.wait_for_tasks_enabled:
+                for task, task_entities in created_tasks:
+                    tasks_entities[task.id] = (task, json_serialize(task_entities))
+                    tasks_created_at[task.id] = created_at
+
+        # Entities are pushed to magneto as soon as a full chunk is available, so the mapped entities held by a method
+        # are bounded by the chunk size instead of the total number of entities. Pushes run in the background (up to
+        # the push window) while the method keeps producing entities.
         start_time = time.time()
-        method_entities = [e async for e in _run_integration_method_to_entities(instance=instance, method=method)]
+        try:
+            async with anyio.create_task_group() as push_task_group:
+                chunk = []
+                async for entity in _run_integration_method_to_entities(instance=instance, method=method):
+                    chunk.append(entity)
+                    method_entities_count += 1
+                    if len(chunk) >= magneto_client.BULK_CHUNK_SIZE:
+                        await task_group_run_with_semaphore(push_task_group, push_semaphore, _push_entities, chunk)
+                        chunk = []
+                if chunk:
+                    await task_group_run_with_semaphore(push_task_group, push_semaphore, _push_entities, chunk)
+        except ExceptionGroup as excgroup:
+            # Keep raising the original error (e.g. IntegrationRunMethodError) instead of the task group one
+            raise excgroup.exceptions[0] from excgroup
         end_time = time.time()
         logger.debug(
             "%-*s | Execution: %d ms", method_logger_width, method.__name__, int((end_time - start_time) * 1000)
         )
 
-        logger.info("%-*s | Entities found: %d", method_logger_width, method.__name__, len(method_entities))
-        logger.debug("%-*s | Results: %r", method_logger_width, method.__name__, method_entities)
-
+        logger.info("%-*s | Entities found: %d", method_logger_width, method.__name__, method_entities_count)
+        if entity_fingerprints is not None:
+            logger.info(
+                "%-*s | Entities unchanged since last run: %d",
+                method_logger_width,
+                method.__name__,
+                method_unchanged_count,
+            )
         if not instance.is_dry_run:
-            created_tasks = await magneto_client.upsert_entities_bulk_chunks(method_entities)
-            logger.info("%-*s | Push tasks created: %d", method_logger_width, method.__name__, len(created_tasks))
+            logger.info("%-*s | Push tasks created: %d", method_logger_width, method.__name__, method_tasks_count)
 
-        for task, entities in created_tasks:
-            tasks_entities[task.id] = (task, entities)
-        entities_found[method.__name__] = len(method_entities)
+        entities_found[method.__name__] = method_entities_count
+        entities_unchanged[method.__name__] = method_unchanged_count
+        tasks_created[method.__name__] = method_tasks_count
 
     for group, methods in _group_methods(instance._methods).items():
         logger.debug("Executing task group: %r", group)
@@ -189,13 +283,20 @@ async def run_integration_methods(
             )
 
     logger.info("Entities found (total: %d): %r", sum(entities_found.values()), entities_found)
+    if entity_fingerprints is not None:
+        logger.info(
+            "Entities unchanged since last run (total: %d): %r", sum(entities_unchanged.values()), entities_unchanged
+        )
 
     if not instance.config.integration.wait_for_tasks_enabled:
-        logger.info("Not waiting for push tasks (created tasks: %d)", len(tasks_entities))
+        logger.info("Not waiting for push tasks (created tasks: %d)", sum(tasks_created.values()))
+        if entity_fingerprints is not None:
+            logger.warning("Entity fingerprints are only recorded when waiting for push tasks is enabled")
     elif not instance.is_dry_run:
         try:
             tasks_success, tasks_failed = await _wait_for_push_tasks_to_finish(
                 entities_tasks=tasks_entities,
+                tasks_created_at=tasks_created_at,
                 magneto_client=magneto_client,
                 logger=logger,
                 timeout=instance.config.integration.wait_for_tasks_timeout_seconds,
@@ -211,6 +312,7 @@ async def run_integration_methods(
                     magneto_client=magneto_client,
                     logger=logger,
                     timeout=instance.config.integration.wait_for_tasks_timeout_seconds,
+                    max_concurrency=instance.config.integration.push_tasks_max_concurrency,
                 )
                 if retried_tasks_success:
                     tasks_success.update(retried_tasks_success)
@@ -222,9 +324,16 @@ async def run_integration_methods(
                 else:
                     logger.info("All push tasks retries failed (%d)", len(tasks_failed))
 
+            if entity_fingerprints is not None:
+                await run_in_thread(
+                    entity_fingerprints.record,
+                    (entity for _, entities in tasks_success.values() for entity in json_deserialize(entities)),
+                )
+
             if tasks_failed:
                 logger.warning("Failed to push %d entities", len(tasks_failed))
-                for task, entities in tasks_failed.values():
+                for task, serialized_entities in tasks_failed.values():
+                    entities = json_deserialize(serialized_entities)
                     # These are considered warnings and not errors as they are not fatal for the integration run
                     warnings.append(
                         EntityPushTaskError(
@@ -248,10 +357,20 @@ async def run_integration_methods(
 async def _run_integration_method_to_entities(
     *, instance: Integration, method: Callable
 ) -> AsyncGenerator[dict[str, Any], None]:
+    """Run an integration method and yield the entities it produces.
+
+    Methods can either be coroutines returning all the entities at once or async generators yielding batches
+    (lists) of entities as soon as they are available.
+    """
     try:
-        entities = await method(instance)
-        for entity in entities or ():
-            yield entity
+        result = method(instance)
+        if inspect.isasyncgen(result):
+            async for entities in result:
+                for entity in entities or ():
+                    yield entity
+        else:
+            for entity in (await result) or ():
+                yield entity
     except Exception as e:
         traceback.print_exc()
         raise IntegrationRunMethodError(
@@ -261,19 +380,26 @@ async def _run_integration_method_to_entities(
 
 async def _retry_failed_push_tasks(
     *,
-    failed_tasks: dict[str, TaskWithEntities],
+    failed_tasks: dict[str, TaskWithSerializedEntities],
     magneto_client: Magneto,
     logger: logging.Logger,
     timeout: int | None = None,
-) -> tuple[dict[str, TaskWithEntities], dict[str, TaskWithEntities]]:
-    entities_from_failed_tasks = [entity for _, entities in failed_tasks.values() for entity in entities]
+    max_concurrency: int = 1,
+) -> tuple[dict[str, TaskWithSerializedEntities], dict[str, TaskWithSerializedEntities]]:
+    entities_from_failed_tasks = [
+        entity for _, entities in failed_tasks.values() for entity in json_deserialize(entities)
+    ]
     logger.info("Entities from failed tasks to retry: %d", len(entities_from_failed_tasks))
 
-    created_tasks = await magneto_client.upsert_entities_bulk_chunks(entities_from_failed_tasks, chunk_size=1)
+    created_tasks = await magneto_client.upsert_entities_bulk_chunks(
+        entities_from_failed_tasks, chunk_size=1, max_concurrency=max_concurrency
+    )
+    created_at = time.monotonic()
     logger.info("Push tasks created for retry: %d", len(created_tasks))
 
     return await _wait_for_push_tasks_to_finish(
-        entities_tasks={task.id: (task, entities) for task, entities in created_tasks},
+        entities_tasks={task.id: (task, json_serialize(entities)) for task, entities in created_tasks},
+        tasks_created_at=dict.fromkeys((task.id for task, _ in created_tasks), created_at),
         magneto_client=magneto_client,
         logger=logger,
         timeout=timeout,
@@ -282,27 +408,45 @@ async def _retry_failed_push_tasks(
 
 async def _wait_for_push_tasks_to_finish(
     *,
-    entities_tasks: dict[str, TaskWithEntities],
+    entities_tasks: dict[str, tuple[TaskRead, T]],
+    tasks_created_at: dict[str, float] | None = None,
     magneto_client: Magneto,
     logger: logging.Logger,
     timeout: int | None = None,
-) -> tuple[dict[str, TaskWithEntities], dict[str, TaskWithEntities]]:
+) -> tuple[dict[str, tuple[TaskRead, T]], dict[str, tuple[TaskRead, T]]]:
     if not entities_tasks:
-        return [], []
+        return {}, {}
 
-    tasks_success: dict[str, TaskWithEntities] = {}
-    tasks_errors: dict[str, TaskWithEntities] = {}
+    tasks_success: dict[str, tuple[TaskRead, T]] = {}
+    tasks_errors: dict[str, tuple[TaskRead, T]] = {}
+
+    # Time each task took to finish since it was created (`time.monotonic()` timestamps, defaulting to when we started
+    # waiting for it), used to estimate when to poll the others
+    tasks_durations: list[float] = []
+    start_time = time.monotonic()
+    tasks_created_at = {task_id: (tasks_created_at or {}).get(task_id, start_time) for task_id in entities_tasks}
+    tasks_next_poll_at = dict.fromkeys(entities_tasks, start_time)
 
     async def _func() -> None:
-        task_ids = (task_id for task_id in entities_tasks)
-        while True:
-            logger.info(
-                "Waiting for push tasks to finish (%d / %d)",
-                len(tasks_success) + len(tasks_errors),
+        tasks_finished_logged = None
+        while tasks_next_poll_at:
+            tasks_finished = len(tasks_success) + len(tasks_errors)
+            # Progress is only logged when it changes as pending tasks may be polled every few seconds
+            logger.log(
+                logging.INFO if tasks_finished != tasks_finished_logged else logging.DEBUG,
+                "Waiting for push tasks to finish (%d / %d): success=%d, failed=%d, running=%d",
+                tasks_finished,
                 len(entities_tasks),
+                len(tasks_success),
+                len(tasks_errors),
+                len(tasks_next_poll_at),
             )
-            task_ids_unfinished = []
+            tasks_finished_logged = tasks_finished
+
+            now = time.monotonic()
+            task_ids = [task_id for task_id, poll_at in tasks_next_poll_at.items() if poll_at <= now]
             async for task in magneto_client.get_tasks(task_ids=task_ids):
+                polled_at = time.monotonic()
                 match task.status:
                     case magneto_models.TaskStatus.SUCCESS:
                         logger.debug("Task %r finished successfully", task.id)
@@ -312,15 +456,18 @@ async def _wait_for_push_tasks_to_finish(
                         logger.debug("Task %r error message: %s", task.id, task.error.message)
                         tasks_errors[task.id] = (task, entities_tasks[task.id][1])
                     case magneto_models.TaskStatus.CREATED | magneto_models.TaskStatus.RUNNING:
-                        logger.debug("Task %r still running", task.id)
-                        task_ids_unfinished.append(task.id)
+                        delay = _next_push_task_poll_delay(polled_at - tasks_created_at[task.id], tasks_durations)
+                        logger.debug("Task %r still running, polling again in %.1fs", task.id, delay)
+                        tasks_next_poll_at[task.id] = polled_at + delay
+                        continue
                     case _:
                         raise ValueError(f"Unknown task status: {task.status}")
 
-            if len(task_ids_unfinished) == 0:
-                break
-            await anyio.sleep(5)
-            task_ids = task_ids_unfinished
+                tasks_durations.append(polled_at - tasks_created_at[task.id])
+                del tasks_next_poll_at[task.id]
+
+            if tasks_next_poll_at:
+                await anyio.sleep(max(min(tasks_next_poll_at.values()) - time.monotonic(), 0))
 
     if timeout is not None and timeout <= 0:
         timeout = None
@@ -332,6 +479,18 @@ async def _wait_for_push_tasks_to_finish(
     return tasks_success, tasks_errors
 
 
+def _next_push_task_poll_delay(elapsed: float, durations: list[float]) -> float:
+    """Estimate how long to wait before polling a push task that is still running.
+
+    While tasks are expected to finish soon (based on the median time the finished tasks took), the task is polled
+    right when it is expected to finish. Tasks taking longer than usual are polled with a backoff proportional to the
+    time elapsed since they were created.
+    """
+    remaining = statistics.median(durations) - elapsed if durations else 0
+    delay = remaining if remaining > 0 else elapsed / 2
+    return min(max(delay, PUSH_TASKS_POLL_MIN_INTERVAL), PUSH_TASKS_POLL_MAX_INTERVAL)
+
+
 def _group_methods(method_registry: list) -> OrderedDict[int, list[Any]]:
     grouped_methods = OrderedDict()
     for func, group in method_registry:
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from http import HTTPStatus
 from typing import Any, TypeAlias
 
+import anyio
 import magneto_api_client
 from magneto_api_client import (
     ApiResponse,
@@ -22,7 +23,9 @@ from magneto_api_client import models as magneto_models
 from magneto_api_client.exceptions import ApiException, BadRequestException, NotFoundException
 from pydantic import ValidationError
 
-from galaxy.utils.itertools import chunks
+from galaxy.utils.concurrency import task_group_run_with_semaphore
+from galaxy.utils.itertools import chunks_by_size
+from galaxy.utils.serializers import json_serialize
 
 __all__ = ["Magneto", "magneto_models", "TaskWithEntities"]
 
@@ -32,6 +35,9 @@ TaskWithEntities: TypeAlias = tuple[TaskRead, list[dict[str, Any]]]
 
 class Magneto:
     BULK_CHUNK_SIZE: int = 100
+    BULK_CHUNK_MAX_BYTES: int = 4 * 1024 * 1024
+    BULK_MAX_CONCURRENCY: int = 1
+    TASKS_MAX_CONCURRENCY: int = 10
 
     def __init__(self, magneto_url: str, magneto_token: str, logger: logging.Logger):
         self.magneto_url = magneto_url.rstrip("/api/v1")
@@ -40,6 +46,10 @@ class Magneto:
         self.headers = {"Authorization": f"Bearer {magneto_token}", "Content-Type": "application/json"}
         self.session = None
 
+        # Payload size limits learned from the API responses, kept for the rest of the run
+        self.bulk_chunk_max_bytes = self.BULK_CHUNK_MAX_BYTES
+        self.bulk_chunk_accepted_bytes = 0
+
     async def __aenter__(self):
         self.session = magneto_api_client.ApiClient(
             magneto_api_client.Configuration(access_token=self.magneto_token, host=self.magneto_url)
@@ -172,11 +182,22 @@ class Magneto:
         except Exception as e:
             raise Exception("Exception when calling TasksApi->get_task_api_v1_tasks_id_get: %s\n" % e)
 
-    async def get_tasks(self, task_ids: Collection[str]) -> AsyncGenerator[TaskRead, None]:
-        # Currently there is not an endpoint to get multiple tasks, so this is a custom implementation that just
-        # calls get_task for each task_id
-        for task_id in task_ids:
-            task = await self.get_task(task_id)
+    async def get_tasks(
+        self, task_ids: Collection[str], *, max_concurrency: int = TASKS_MAX_CONCURRENCY
+    ) -> AsyncGenerator[TaskRead, None]:
+        # Currently there is not an endpoint to get multiple tasks, so this is a custom implementation that calls
+        # get_task for each task_id, with at most `max_concurrency` requests in flight
+        tasks: list[TaskRead] = []
+
+        async def _get_task(task_id: str) -> None:
+            tasks.append(await self.get_task(task_id))
+
+        async with anyio.create_task_group() as task_group:
+            semaphore = anyio.Semaphore(max_concurrency)
+            for task_id in task_ids:
+                await task_group_run_with_semaphore(task_group, semaphore, _get_task, task_id)
+
+        for task in tasks:
             yield task
 
     async def create_task(self, task: dict[str, Any] | TaskCreate) -> TaskRead:
@@ -227,6 +248,7 @@ class Magneto:
         update_properties_and_relations_only: bool = False,
         patch: bool = True,
         chunk_size: int = BULK_CHUNK_SIZE,
+        max_concurrency: int = BULK_MAX_CONCURRENCY,
     ) -> list[TaskWithEntities]:
         """Create tasks to upsert entities in chunks to avoid hitting the API limits.
 
@@ -238,11 +260,15 @@ class Magneto:
         If there are still errors after the retries that contain a single entity is means that the issues are related
         to the entities of those tasks.
 
+        Chunks are also limited by their serialized size. When a chunk is rejected with 413 the size limit is lowered
+        (but never below the largest chunk accepted so far) so the following chunks are packed within it.
+
         Args:
             entities: list of entities to upsert
             update_properties_and_relations_only: if True, only properties and relations will be updated
             patch: if True, only properties and relations will be updated
             chunk_size: number of entities to upsert in each chunk
+            max_concurrency: maximum number of task creation requests in flight at the same time
 
         Returns:
             list of tasks created
@@ -253,26 +279,45 @@ class Magneto:
         entities_to_add = entities
         errors_counter = Counter()
 
-        while True:
-            for chunk in chunks(entities_to_add, chunk_size):
-                try:
-                    task = await self.upsert_entities_bulk_task(
-                        chunk, update_properties_and_relations_only=update_properties_and_relations_only, patch=patch
+        entities_bytes = {id(entity): len(json_serialize(entity)) for entity in entities}
+
+        def _entity_bytes(entity: dict[str, Any]) -> int:
+            return entities_bytes[id(entity)]
+
+        async def _create_task(chunk: list[dict[str, Any]], chunk_size: int) -> None:
+            chunk_bytes = sum(_entity_bytes(entity) for entity in chunk)
+            try:
+                task = await self.upsert_entities_bulk_task(
+                    chunk, update_properties_and_relations_only=update_properties_and_relations_only, patch=patch
+                )
+                created_tasks.append((task, chunk))
+                self.bulk_chunk_accepted_bytes = max(self.bulk_chunk_accepted_bytes, chunk_bytes)
+            except MagnetoApiError as e:
+                if e.status_code not in (HTTPStatus.REQUEST_ENTITY_TOO_LARGE, HTTPStatus.UNPROCESSABLE_ENTITY):
+                    raise
+
+                if e.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE and len(chunk) > 1:
+                    self._update_bulk_chunk_max_bytes(chunk_bytes)
+
+                if chunk_size <= 1:
+                    errors_counter[e.status_code] += 1
+                    self.logger.debug(
+                        "Failed to create task to insert entity %r to Rely API: %r (entity: %r)",
+                        chunk[0].get("id"),
+                        e,
+                        chunk[0],
                     )
-                    created_tasks.append((task, chunk))
-                except MagnetoApiError as e:
-                    if e.status_code not in (HTTPStatus.REQUEST_ENTITY_TOO_LARGE, HTTPStatus.UNPROCESSABLE_ENTITY):
-                        raise
-
-                    if chunk_size <= 1:
-                        errors_counter[e.status_code] += 1
-                        self.logger.debug(
-                            "Failed to create task to insert entity %r to Rely API: %r (entity: %r)",
-                            chunk[0].get("id"),
-                            e,
-                            chunk[0],
-                        )
-                    missing_entities.extend(chunk)
+                missing_entities.extend(chunk)
+
+        while True:
+            try:
+                async with anyio.create_task_group() as task_group:
+                    semaphore = anyio.Semaphore(max_concurrency)
+                    for chunk in chunks_by_size(entities_to_add, chunk_size, self.bulk_chunk_max_bytes, _entity_bytes):
+                        await task_group_run_with_semaphore(task_group, semaphore, _create_task, chunk, chunk_size)
+            except ExceptionGroup as excgroup:
+                # Keep raising the error of the failed request instead of the task group one
+                raise excgroup.exceptions[0] from excgroup
 
             if len(missing_entities) == 0:
                 break
@@ -297,6 +342,16 @@ class Magneto:
 
         return created_tasks
 
+    def _update_bulk_chunk_max_bytes(self, rejected_bytes: int) -> None:
+        if rejected_bytes > self.bulk_chunk_max_bytes:
+            return
+
+        max_bytes = rejected_bytes // 2
+        if self.bulk_chunk_accepted_bytes < rejected_bytes:
+            max_bytes = max(max_bytes, self.bulk_chunk_accepted_bytes)
+        self.bulk_chunk_max_bytes = max_bytes
+        self.logger.debug("Bulk upsert chunks limited to %d bytes", max_bytes)
+
 
 @dataclass(kw_only=True)
 class MagnetoApiError(Exception):
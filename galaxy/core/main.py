@@ -78,6 +78,8 @@ async def main(
 
         # Create an instance of the plugin
         instance = await import_and_instantiate_integration(module_name, class_name, config=config)
+        # Compile all the mappings upfront so that invalid mappings fail at startup instead of in the middle of a run
+        instance.mapper.compile_all_mappings()
 
         if config.integration.execution_type == ExecutionType.CRONJOB:
             logger.info("Running galaxy framework in cronjob mode")
@@ -1,39 +1,105 @@
+import hashlib
+import json
+import logging
+import math
 import re
+import threading
 from typing import Any
 
+import anyio
 import jq
 import yaml
 
 from galaxy.core.resources import load_integration_resource
-from galaxy.utils.concurrency import run_in_thread
+from galaxy.utils.concurrency import run_in_process, run_in_thread, set_process_pool_limit
 
 __all__ = ["Mapper", "MapperError", "MapperNotFoundError", "MapperCompilationError"]
 
 
 class Mapper:
     MAPPINGS_FILE_PATH: str = ".rely/mappings.yaml"
+    PROCESS_THRESHOLD: int = 1000
 
-    def __init__(self, integration_name: str):
+    def __init__(self, integration_name: str, *, processes: int = 0, process_threshold: int = PROCESS_THRESHOLD):
         self.integration_name = integration_name
+        self.logger = logging.getLogger("galaxy")
         self.id_allowed_chars = "[^a-zA-Z0-9-]"
 
-        self._mappings: dict[str, dict[str, Any]] | None = None
-        self._compiled_mappings: dict[str, dict[str, Any]] = {}
+        # Lists with at least `process_threshold` items are mapped in `processes` worker processes (0 to disable)
+        self.processes = processes
+        self.process_threshold = process_threshold
+
+        # Key of the compiled mappings in the registry shared by all the mappers of the process
+        self._mappings_key: tuple[str, str] | None = None
+
+    @property
+    def _compiled(self) -> "_CompiledMappings":
+        if self._mappings_key is None:
+            content = load_integration_resource(self.integration_name, self.MAPPINGS_FILE_PATH)
+            mappings_key = (self.integration_name, hashlib.sha256(content.encode()).hexdigest())
+            with _compiled_mappings_registry_lock:
+                if mappings_key not in _compiled_mappings_registry:
+                    mappings = yaml.safe_load(content)
+                    _compiled_mappings_registry[mappings_key] = _CompiledMappings(
+                        {mapping["kind"]: mapping["mappings"] for mapping in mappings.get("resources") or []}
+                    )
+            self._mappings_key = mappings_key
+        return _compiled_mappings_registry[self._mappings_key]
 
     @property
     def mappings(self) -> dict[str, dict[str, Any]]:
-        if self._mappings is None:
-            mappings = yaml.safe_load(load_integration_resource(self.integration_name, self.MAPPINGS_FILE_PATH))
-            self._mappings = {mapping["kind"]: mapping["mappings"] for mapping in mappings.get("resources") or []}
-        return self._mappings
+        return self._compiled.mappings
+
+    def compile_all_mappings(self) -> None:
+        """Compile the mappings of all kinds, raising `MapperCompilationError` for the first one that is invalid."""
+        for mapping_kind in self.mappings:
+            self.get_compiled_mappings(mapping_kind)
+            self.get_compiled_program(mapping_kind)
 
     def get_compiled_mappings(self, mapping_kind: str) -> list[Any]:
-        if mapping_kind not in self._compiled_mappings:
+        compiled_mappings = self._compiled.compiled_mappings
+        if mapping_kind not in compiled_mappings:
             try:
-                self._compiled_mappings[mapping_kind] = self._compile_mappings(self.mappings.get(mapping_kind) or {})
+                compiled_mappings[mapping_kind] = self._compile_mappings(self.mappings.get(mapping_kind) or {})
             except Exception as e:
                 raise MapperCompilationError(mapping_kind) from e
-        return self._compiled_mappings[mapping_kind]
+        return compiled_mappings[mapping_kind]
+
+    def get_compiled_program(self, mapping_kind: str) -> "jq._Program | None":
+        """Get a single jq program mapping a list of items (with the `context` key) into a list of entities.
+
+        Returns `None` when the mappings can not be combined into one program, in which case each field is mapped
+        separately.
+        """
+        compiled_programs = self._compiled.compiled_programs
+        if mapping_kind not in compiled_programs:
+            try:
+                expression = self._combine_mappings(self.mappings.get(mapping_kind) or {})
+                program = jq.compile(f".context as $__context | .items[] | . + {{context: $__context}} | {expression}")
+            except ValueError as e:
+                self.logger.debug(
+                    "Could not combine the mappings of kind %s, mapping each field separately: %s", mapping_kind, e
+                )
+                program = None
+            compiled_programs[mapping_kind] = program
+        return compiled_programs[mapping_kind]
+
+    def _combine_mappings(self, item: Any) -> str:
+        if isinstance(item, dict):
+            if not all(isinstance(key, str) for key in item):
+                raise ValueError("Only string keys can be combined into a jq object")
+            return (
+                "{"
+                + ", ".join(f"{json.dumps(key)}: {self._combine_mappings(value)}" for key, value in item.items())
+                + "}"
+            )
+        if isinstance(item, list | tuple | set):
+            return "[" + ", ".join(self._combine_mappings(value) for value in item) + "]"
+        if isinstance(item, str):
+            # Each field keeps only its first output, like `_map_data` does, and the expression is wrapped in its own
+            # line so that trailing comments do not swallow the closing parentheses.
+            return f"first((\n{item}\n))"
+        return json.dumps(item)
 
     def _compile_mappings(self, item: Any) -> Any:
         if isinstance(item, dict):
@@ -92,13 +158,81 @@ class Mapper:
         mappings = self.get_compiled_mappings(mapping_kind)
         if not mappings:
             raise MapperNotFoundError(mapping_kind)
+
+        if program := self.get_compiled_program(mapping_kind):
+            try:
+                entities = program.input_value({"items": json_data, "context": context}).all()
+            except ValueError as e:
+                self.logger.debug("Could not map kind %s at once, mapping each field separately: %s", mapping_kind, e)
+                entities = None
+            # A field without output drops its entity from the results: map each field separately to report it
+            if entities is not None and len(entities) == len(json_data):
+                return [self._sanitize(entity) for entity in entities]
+            if entities is not None:
+                self.logger.debug(
+                    "Mapped %d entities of kind %s from %d items, mapping each field separately",
+                    len(entities),
+                    mapping_kind,
+                    len(json_data),
+                )
+
         return [self._map_entity(mappings, {**each, "context": context}) for each in json_data]
 
     async def process(self, mapping_kind: str, json_data: list[dict], context: Any | None = None) -> tuple[Any]:
-        # There is no advantage in using async here as all the work is done in a thread.
-        # Keeping it as async for now to avoid breaking existing code that calls this as `await mapper.process(...)`.
+        # Mapping is CPU bound: large lists are mapped in worker processes so they do not hold the GIL of the event loop
+        if self.processes > 0 and len(json_data) >= self.process_threshold:
+            return await self._process_in_workers(mapping_kind, json_data, context)
         return await run_in_thread(self.process_sync, mapping_kind, json_data, context)
 
+    async def _process_in_workers(self, mapping_kind: str, json_data: list[dict], context: Any | None) -> list[Any]:
+        # Compile the mappings here first so that unknown or invalid mappings are raised as when mapping in a thread
+        if not self.get_compiled_mappings(mapping_kind):
+            raise MapperNotFoundError(mapping_kind)
+
+        set_process_pool_limit(self.processes)
+        shard_size = math.ceil(len(json_data) / self.processes)
+        shards = [json_data[i : i + shard_size] for i in range(0, len(json_data), shard_size)]
+        results: list[list[Any]] = [[] for _ in shards]
+
+        async def _process_shard(index: int, shard: list[dict]) -> None:
+            results[index] = await run_in_process(
+                _process_sync_in_worker, self.integration_name, mapping_kind, shard, context
+            )
+
+        try:
+            async with anyio.create_task_group() as task_group:
+                for index, shard in enumerate(shards):
+                    task_group.start_soon(_process_shard, index, shard)
+        except ExceptionGroup as excgroup:
+            raise excgroup.exceptions[0] from excgroup
+
+        return [entity for result in results for entity in result]
+
+
+class _CompiledMappings:
+    def __init__(self, mappings: dict[str, dict[str, Any]]):
+        self.mappings = mappings
+        self.compiled_mappings: dict[str, Any] = {}
+        self.compiled_programs: dict[str, jq._Program | None] = {}
+
+
+# Compiled mappings by integration type and hash of its mappings file, shared by all the mappers of the process so
+# that copies of an integration (e.g. on each daemon run) and the webhook routes do not compile them again
+_compiled_mappings_registry: dict[tuple[str, str], _CompiledMappings] = {}
+_compiled_mappings_registry_lock = threading.Lock()
+
+
+# Mappers of a worker process, by integration, so that each worker compiles the mappings only once
+_worker_mappers: dict[str, Mapper] = {}
+
+
+def _process_sync_in_worker(
+    integration_name: str, mapping_kind: str, json_data: list[dict], context: Any | None
+) -> list[Any]:
+    if integration_name not in _worker_mappers:
+        _worker_mappers[integration_name] = Mapper(integration_name)
+    return _worker_mappers[integration_name].process_sync(mapping_kind, json_data, context)
+
 
 class MapperError(Exception):
     """Base class for Mapper errors."""
@@ -39,8 +39,17 @@ class IntegrationConfig(BaseModel):
     dry_run: bool = Field(False, alias="dryRun")
     properties: dict[str, Any] = Field(..., alias="properties")
 
+    # Entities are pushed in chunks as the integration methods produce them. While waiting for the push tasks is
+    # enabled, the pushed entities are also kept (serialized) until the end of the run to retry the failed tasks, so
+    # memory grows with the total size of the entities. Disabling it bounds memory to the chunks being pushed.
     wait_for_tasks_enabled: bool = Field(True, alias="waitForTasksEnabled")
     wait_for_tasks_timeout_seconds: int | None = Field(600, alias="waitForTasksTimeout")
+    push_tasks_max_concurrency: int = Field(5, alias="pushTasksMaxConcurrency", ge=1)
+    entity_fingerprints_path: str | None = Field(None, alias="entityFingerprintsPath")
+    # Fingerprints older than this are ignored so every entity is pushed again at least once per period
+    entity_fingerprints_max_age_seconds: int | None = Field(86400, alias="entityFingerprintsMaxAge", ge=1)
+    mapper_processes: int = Field(0, alias="mapperProcesses", ge=0)
+    mapper_process_threshold: int = Field(1000, alias="mapperProcessThreshold", ge=1)
 
     def __repr__(self) -> str:
         """Return a string representation of the IntegrationConfig.
@@ -51,7 +60,11 @@ class IntegrationConfig(BaseModel):
             f"IntegrationConfig(id={self.id}, type={self.type}, execution_type={self.execution_type}, "
             f"scheduled_interval={self.scheduled_interval}, default_model_mappings={self.default_model_mappings}, "
             f"dry_run={self.dry_run}, wait_for_tasks_enabled={self.wait_for_tasks_enabled}, "
-            f"wait_for_tasks_timeout_seconds={self.wait_for_tasks_timeout_seconds})"
+            f"wait_for_tasks_timeout_seconds={self.wait_for_tasks_timeout_seconds}, "
+            f"push_tasks_max_concurrency={self.push_tasks_max_concurrency}, "
+            f"entity_fingerprints_path={self.entity_fingerprints_path}, "
+            f"entity_fingerprints_max_age_seconds={self.entity_fingerprints_max_age_seconds}, "
+            f"mapper_processes={self.mapper_processes}, mapper_process_threshold={self.mapper_process_threshold})"
         )
 
 
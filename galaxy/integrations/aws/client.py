@@ -1,17 +1,29 @@
-import asyncio
+import functools
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable
+from types import TracebackType
+from typing import Any, ParamSpec, TypeVar
 
+import anyio
 import boto3
+from anyio import to_thread
+from botocore.config import Config as BotocoreConfig
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from galaxy.core.models import Config
+from galaxy.integrations.aws.utils import to_json_compatible
+from galaxy.utils.concurrency import get_api_max_concurrency, task_group_run_with_semaphore
 
 __all__ = ["AwsClient"]
 
 logger = logging.getLogger("galaxy")
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
 
 def log_attempt_number(retry_state):
     """return the result of the last call attempt"""
@@ -19,6 +31,10 @@ def log_attempt_number(retry_state):
 
 
 class AwsClient:
+    DEFAULT_API_MAX_CONCURRENCY: int = 10
+    MAX_ATTEMPTS: int = 10
+    EC2_PAGE_SIZE: int = 1000
+
     def __init__(self, config: Config, logger: logging.Logger):
         self.logger = logger
         self.config = config
@@ -41,102 +57,140 @@ class AwsClient:
 
         self.aws_session = boto3.Session(aws_access_key_id=access_key_id, aws_secret_access_key=access_key_secret)
 
-    async def get_regions(self, base_region) -> list[dict]:
-        return self.aws_session.client("ec2", region_name=base_region).describe_regions()["Regions"]
+        # boto3 calls are blocking: they all run in worker threads, up to `api_max_concurrency` at a time, with clients
+        # shared between threads (boto3 clients are thread safe, but sessions are not, so clients are created once).
+        # They are only created when entering the client as the limiter and the lock cannot be deep copied.
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._clients: dict[tuple[str, str], Any] = {}
+        self._clients_lock: threading.Lock | None = None
+
+    async def __aenter__(self) -> "AwsClient":
+        self._limiter = anyio.CapacityLimiter(self.api_max_concurrency)
+        self._clients_lock = threading.Lock()
+        return self
+
+    async def __aexit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
+        self._limiter = None
+        self._clients = {}
+        self._clients_lock = None
+
+    @property
+    def api_max_concurrency(self) -> int:
+        return get_api_max_concurrency(
+            self.config.integration.properties, self.DEFAULT_API_MAX_CONCURRENCY, self.logger
+        )
 
-    async def get_accounts(self, region: str) -> list[dict]:
-        aws_cloudcontrol_client = self.aws_session.client("cloudcontrol", region_name=region)
-        resource_type = "AWS::Organizations::Account"
+    def get_client(self, service: str, region: str) -> Any:
+        """Get the boto3 client of a service in a region, created on first use."""
+        if self._clients_lock is None:
+            raise ValueError("AWS client has not been entered")
+
+        with self._clients_lock:
+            if (service, region) not in self._clients:
+                self._clients[(service, region)] = self.aws_session.client(
+                    service,
+                    region_name=region,
+                    config=BotocoreConfig(
+                        max_pool_connections=self.api_max_concurrency,
+                        # Throttled calls are retried with backoff, and each client (so each service and region)
+                        # slows down its own rate of calls when throttled
+                        retries={"mode": "adaptive", "max_attempts": self.MAX_ATTEMPTS},
+                    ),
+                )
+            return self._clients[(service, region)]
 
-        # Fetch Resource References
-        try:
-            resources_descriptions = aws_cloudcontrol_client.list_resources(**{"TypeName": resource_type}).get(
-                "ResourceDescriptions", []
-            )
-        except Exception as e:
-            logger.error(f"Failed to list resources for kind: {resource_type}")
-            raise e
+    async def _call(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Call the given blocking function in a worker thread, without blocking the event loop."""
+        if self._limiter is None:
+            raise ValueError("AWS client has not been entered")
 
-        # Fetch Resource Payloads
-        resources = []
-        for description in resources_descriptions:
-            resource_id = description.get("Identifier")
-            if not resource_id:
-                logger.error(f"Failed get individual resource (no id). Kind: {resource_type}: {description}")
-
-            response = (
-                aws_cloudcontrol_client.get_resource(TypeName=resource_type, Identifier=resource_id)
-                .get("ResourceDescription", {})
-                .get("Properties", None)
-            )
-            if response:
-                resources.append(json.loads(response))
+        if kwargs:
+            func = functools.partial(func, **kwargs)
+        return await to_thread.run_sync(func, *args, limiter=self._limiter)
 
-        return resources
+    async def get_regions(self, base_region) -> list[dict]:
+        aws_ec2_client = await self._call(self.get_client, "ec2", base_region)
+        response = await self._call(aws_ec2_client.describe_regions)
+        return response["Regions"]
 
-    async def get_ec2s(self, region):
-        ec2s = []
+    async def get_accounts(self, region: str) -> list[dict]:
+        return await self.get_generic_resources(region, "AWS::Organizations::Account")
 
-        # List all EC2s in region
-        aws_ec2_client = self.aws_session.resource("ec2", region_name=region)
+    async def get_ec2s(self, region):
+        # Describe all EC2s in region, up to 1000 per call
         try:
-            ec2s_metadata = aws_ec2_client.instances.all()
+            return await self._call(self.describe_ec2s, region)
         except Exception as e:
             logger.error(f"Failed to list EC2 Instance in region: {region}; error {e}")
+            return []
 
-        # Fetch all more specific details about each EC2 in parallel
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = [executor.submit(self.get_ec2, instance.id, region) for instance in ec2s_metadata]
+    def describe_ec2s(self, region):
+        paginator = self.get_client("ec2", region).get_paginator("describe_instances")
+        return [
+            to_json_compatible(instance)
+            for page in paginator.paginate(PaginationConfig={"PageSize": self.EC2_PAGE_SIZE})
+            for reservation in page.get("Reservations", [])
+            for instance in reservation.get("Instances", [])
+        ]
 
-            for completed_future in as_completed(futures):
-                result = completed_future.result()
-                if result:
-                    ec2s.append(result)
+    async def get_generic_resources(self, region, resource_type):
+        started_at = time.monotonic()
+        aws_cloudcontrol_client = await self._call(self.get_client, "cloudcontrol", region)
 
-        return ec2s
+        # The details of each Resource are fetched while the next pages of Resources are listed
+        resources = []
+        semaphore = anyio.Semaphore(self.api_max_concurrency)
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_random_exponential(min=1, max=60), after=log_attempt_number, reraise=True
-    )
-    def get_ec2(self, instance_id, region):
-        aws_ec2_client = self.aws_session.client("ec2", region_name=region)
-        instance_response = aws_ec2_client.describe_instances(InstanceIds=[instance_id])
-        try:
-            instance_obj = instance_response.get("Reservations")[0]["Instances"][0]
-        except Exception as e:
-            logger.error(f"Failed to extract AWS/EC2 from API response id: {instance_id}, error: {e}")
-            raise
-        return json.loads(json.dumps(instance_obj, default=str))
+        async def _get_resource(index: int, resource_id: str) -> None:
+            resources[index] = await self._call(self.get_generic_resource, resource_type, resource_id, region)
 
-    async def get_generic_resources(self, region, resource_type):
-        # List all Resources in region
-        resource_descriptions = (
-            self.aws_session.client("cloudcontrol", region_name=region)
-            .list_resources(**{"TypeName": resource_type})
-            .get("ResourceDescriptions", [])
+        try:
+            async with anyio.create_task_group() as tg:
+                async for resource_id in self._list_resources_ids(aws_cloudcontrol_client, resource_type):
+                    resources.append(None)
+                    await task_group_run_with_semaphore(tg, semaphore, _get_resource, len(resources) - 1, resource_id)
+        except ExceptionGroup as excgroup:
+            raise excgroup.exceptions[0] from excgroup
+
+        resources = [resource for resource in resources if resource is not None]
+        self.logger.info(
+            "Fetched %d resources of kind %s in region %s in %.2fs",
+            len(resources),
+            resource_type,
+            region,
+            time.monotonic() - started_at,
         )
-
-        # Fetch all more specific details about each Resource in parallel
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [
-                loop.run_in_executor(
-                    executor, self.get_generic_resource, resource_type, resource_desc.get("Identifier", ""), region
-                )
-                for resource_desc in resource_descriptions
-            ]
-            resources = await asyncio.gather(*futures)
         return resources
 
+    async def _list_resources_ids(self, aws_cloudcontrol_client, resource_type) -> AsyncGenerator[str, None]:
+        params = {"TypeName": resource_type}
+        while True:
+            try:
+                response = await self._call(aws_cloudcontrol_client.list_resources, **params)
+            except Exception as e:
+                logger.error(f"Failed to list resources for kind: {resource_type}; error {e}")
+                raise
+
+            for description in response.get("ResourceDescriptions", []):
+                resource_id = description.get("Identifier")
+                if not resource_id:
+                    logger.error(f"Failed get individual resource (no id). Kind: {resource_type}: {description}")
+                    continue
+                yield resource_id
+
+            if not response.get("NextToken"):
+                break
+            params["NextToken"] = response["NextToken"]
+
     @retry(
         stop=stop_after_attempt(3), wait=wait_random_exponential(min=1, max=45), after=log_attempt_number, reraise=True
     )
     def get_generic_resource(self, resource_type, resource_id, region):
-        aws_cloudcontrol_client = self.aws_session.client("cloudcontrol", region_name=region)
+        aws_cloudcontrol_client = self.get_client("cloudcontrol", region)
         response = (
             aws_cloudcontrol_client.get_resource(TypeName=resource_type, Identifier=resource_id)
-            .get("ResourceDescription")
+            .get("ResourceDescription", {})
             .get("Properties")
         )
 
-        return json.loads(response)
+        return json.loads(response) if response else None
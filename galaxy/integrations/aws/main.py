@@ -1,6 +1,10 @@
+from collections.abc import Awaitable, Callable
+from types import TracebackType
+
 from galaxy.core.galaxy import Integration, register
 from galaxy.core.models import Config
 from galaxy.integrations.aws.client import AwsClient
+from galaxy.utils.concurrency import run_concurrently
 
 __all__ = ["Aws"]
 
@@ -23,6 +27,19 @@ class Aws(Integration):
         # Global services
         self.s3_buckets = {}
 
+    async def __aenter__(self) -> "Aws":
+        await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
+        await self.client.__aexit__(exc_type, exc, tb)
+
+    async def _get_regions_resources(self, get_resources: Callable[[str], Awaitable[list[dict]]]) -> dict[str, list]:
+        """Get the resources of each region, crawling all the regions concurrently."""
+        # The client limits the number of calls in flight
+        regions = list(self.regions)
+        return dict(zip(regions, await run_concurrently(get_resources, regions)))
+
     @register(_methods, group=1)
     async def regions(self) -> list[dict]:
         for region in await self.client.get_regions(self.default_region):
@@ -61,8 +78,10 @@ class Aws(Integration):
     async def eks_clusters(self) -> list[dict]:
         clusters_mapped = []
 
+        self.regions_to_eks_clusters = await self._get_regions_resources(
+            lambda region: self.client.get_generic_resources(region, "AWS::EKS::Cluster")
+        )
         for region in self.regions.keys():
-            self.regions_to_eks_clusters[region] = await self.client.get_generic_resources(region, "AWS::EKS::Cluster")
             clusters_mapped.extend(
                 (
                     await self.mapper.process(
@@ -79,8 +98,10 @@ class Aws(Integration):
     async def lambdas(self) -> list[dict]:
         lambdas_mapped = []
 
+        self.regions_to_lambdas = await self._get_regions_resources(
+            lambda region: self.client.get_generic_resources(region, "AWS::Lambda::Function")
+        )
         for region in self.regions.keys():
-            self.regions_to_lambdas[region] = await self.client.get_generic_resources(region, "AWS::Lambda::Function")
             lambdas_mapped.extend(
                 (
                     await self.mapper.process(
@@ -97,8 +118,8 @@ class Aws(Integration):
     async def ec2s(self) -> list[dict]:
         ec2s_mapped = []
 
+        self.regions_to_ec2s = await self._get_regions_resources(lambda region: self.client.get_ec2s(region=region))
         for region in self.regions.keys():
-            self.regions_to_ec2s[region] = await self.client.get_ec2s(region=region)
             ec2s_mapped.extend(
                 (
                     await self.mapper.process(
@@ -149,10 +170,10 @@ class Aws(Integration):
     async def rds_db_instances(self) -> list[dict]:
         rds_instances_mapped = []
 
+        self.regions_to_rds_db_instances = await self._get_regions_resources(
+            lambda region: self.client.get_generic_resources(region, "AWS::RDS::DBInstance")
+        )
         for region in self.regions.keys():
-            self.regions_to_rds_db_instances[region] = await self.client.get_generic_resources(
-                region, "AWS::RDS::DBInstance"
-            )
             rds_instances_mapped.extend(
                 (
                     await self.mapper.process(
@@ -0,0 +1,30 @@
+import copy
+
+import pytest
+
+from galaxy.core.models import Config
+from galaxy.integrations.aws.main import Aws
+
+
+@pytest.fixture
+def config():
+    return Config(
+        integration={
+            "type": "aws",
+            "id": "aws_id",
+            "executionType": "daemon",
+            "scheduledInterval": 1,
+            "defaultModelMappings": {},
+            "properties": {"accountId": "123456789012", "accessKey": {"AccessKeyId": "id", "SecretAccessKey": "key"}},
+        },
+        rely={"url": "http://testurl.com", "token": "test_token"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_aws_integration_can_be_deep_copied(config):
+    # Daemon mode runs a deep copy of the integration on each schedule
+    integration = copy.deepcopy(Aws(config))
+
+    async with integration:
+        assert integration.client.get_client("ec2", "us-east-1") is integration.client.get_client("ec2", "us-east-1")
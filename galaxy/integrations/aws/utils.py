@@ -0,0 +1,15 @@
+from datetime import date
+from typing import Any
+
+__all__ = ["to_json_compatible"]
+
+
+def to_json_compatible(value: Any) -> Any:
+    """Convert the dates of a boto3 response to strings, like `json.dumps(value, default=str)` would do."""
+    if isinstance(value, dict):
+        return {key: to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [to_json_compatible(item) for item in value]
+    if isinstance(value, date):
+        return str(value)
+    return value
@@ -1,10 +1,11 @@
 import logging
+from types import TracebackType
 
-import aiohttp
 from aiohttp import ClientResponseError
 
 from galaxy.core.models import Config
 from galaxy.core.utils import make_request
+from galaxy.utils.requests import ClientSession, ConnectionPolicy, create_session, with_session
 from datetime import datetime, timedelta
 import base64
 
@@ -19,6 +20,28 @@ class BitbucketClient:
         self.auth_token = None
         self.headers = None
 
+        self._session: ClientSession | None = None
+        self._connection_policy = ConnectionPolicy.from_properties(config.integration.properties)
+
+    async def __aenter__(self) -> "BitbucketClient":
+        self._session = create_session(connection_policy=self._connection_policy)
+        return self
+
+    async def __aexit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+    @property
+    def session(self) -> ClientSession:
+        """Underlying HTTP client session; ensures methods access an instantiated session."""
+        if self._session is None:
+            raise ValueError("HTTP client session has not been created")
+
+        return self._session
+
     async def init_credentials(self):
         self.auth_token = await self.get_auth_token(self.config.integration.properties["refreshToken"])
         self.headers = {"Authorization": f"Bearer {self.auth_token}", "Content-Type": "application/json"}
@@ -32,7 +55,8 @@ class BitbucketClient:
 
         encoded_credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode("utf-8")
 
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        # The token is requested once when the integration starts, before the client session is created
+        async with with_session(connection_policy=self._connection_policy) as session:
             try:
                 response = await make_request(
                     session,
@@ -55,127 +79,118 @@ class BitbucketClient:
         return access_token
 
     async def get_workspace(self, workspace_slug: str) -> list[dict]:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            try:
-                response = await make_request(
-                    session, "GET", f"{self.url}/workspaces/{workspace_slug}", headers=self.headers
-                )
-            except ClientResponseError as e:
-                raise Exception(f"Client server integration API error: {e.status} {e.message}")
+        try:
+            response = await make_request(
+                self.session, "GET", f"{self.url}/workspaces/{workspace_slug}", headers=self.headers
+            )
+        except ClientResponseError as e:
+            raise Exception(f"Client server integration API error: {e.status} {e.message}")
 
         return response
 
     async def get_projects(self, workspace_slug: str) -> list[dict]:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            try:
-                response = await make_request(
-                    session, "GET", f"{self.url}/workspaces/{workspace_slug}/projects", headers=self.headers
-                )
-                projects = response["values"]
-            except ClientResponseError as e:
-                raise Exception(f"Client server integration API error: {e.status} {e.message}")
+        try:
+            response = await make_request(
+                self.session, "GET", f"{self.url}/workspaces/{workspace_slug}/projects", headers=self.headers
+            )
+            projects = response["values"]
+        except ClientResponseError as e:
+            raise Exception(f"Client server integration API error: {e.status} {e.message}")
         return projects
 
     async def get_users(self, workspace_slug: str) -> list[dict]:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            try:
-                response = await make_request(
-                    session, "GET", f"{self.url}/workspaces/{workspace_slug}/permissions", headers=self.headers
-                )
-                users = response["values"]
-            except ClientResponseError as e:
-                raise Exception(f"Client server integration API error: {e.status} {e.message}")
+        try:
+            response = await make_request(
+                self.session, "GET", f"{self.url}/workspaces/{workspace_slug}/permissions", headers=self.headers
+            )
+            users = response["values"]
+        except ClientResponseError as e:
+            raise Exception(f"Client server integration API error: {e.status} {e.message}")
         return users
 
     async def get_repositories(self, workspace_slug: str) -> list[dict]:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            try:
-                response = await make_request(
-                    session, "GET", f"{self.url}/repositories/{workspace_slug}", headers=self.headers
-                )
-                repositories = response["values"]
-            except ClientResponseError as e:
-                raise Exception(f"Client server integration API error: {e.status} {e.message}")
+        try:
+            response = await make_request(
+                self.session, "GET", f"{self.url}/repositories/{workspace_slug}", headers=self.headers
+            )
+            repositories = response["values"]
+        except ClientResponseError as e:
+            raise Exception(f"Client server integration API error: {e.status} {e.message}")
         return repositories
 
     async def get_readme(self, workspace_slug: str, repo_slug: str, branch: str) -> list[dict]:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            try:
-                response = await make_request(
-                    session,
-                    "GET",
-                    f"{self.url}/repositories/{workspace_slug}/{repo_slug}/src/{branch}/README.md",
-                    headers={"Authorization": f"Bearer {self.auth_token}", "Content-Type": "text/plain"},
-                )
-            except ClientResponseError as e:
-                raise Exception(f"Client server integration API error: {e.status} {e.message}")
+        try:
+            response = await make_request(
+                self.session,
+                "GET",
+                f"{self.url}/repositories/{workspace_slug}/{repo_slug}/src/{branch}/README.md",
+                headers={"Authorization": f"Bearer {self.auth_token}", "Content-Type": "text/plain"},
+            )
+        except ClientResponseError as e:
+            raise Exception(f"Client server integration API error: {e.status} {e.message}")
         return response
 
     async def get_pull_requests(self, workspace_slug: str, repo_slug: str) -> list[dict]:
         start_date = (
             datetime.utcnow() - timedelta(days=int(self.config.integration.properties["daysOfHistory"]))
         ).isoformat()
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            try:
-                response = await make_request(
-                    session,
-                    "GET",
-                    f"{self.url}/repositories/{workspace_slug}/{repo_slug}/pullrequests",
-                    headers=self.headers,
-                    params=[("state", state) for state in ("OPEN", "MERGED", "DECLINED", "SUPERSEDED")]
-                    + [("q", f"created_on>={start_date}Z")],
-                )
-                pull_requests = response["values"]
-            except ClientResponseError as e:
-                raise Exception(f"Client server integration API error: {e.status} {e.message}")
+        try:
+            response = await make_request(
+                self.session,
+                "GET",
+                f"{self.url}/repositories/{workspace_slug}/{repo_slug}/pullrequests",
+                headers=self.headers,
+                params=[("state", state) for state in ("OPEN", "MERGED", "DECLINED", "SUPERSEDED")]
+                + [("q", f"created_on>={start_date}Z")],
+            )
+            pull_requests = response["values"]
+        except ClientResponseError as e:
+            raise Exception(f"Client server integration API error: {e.status} {e.message}")
         return pull_requests
 
     async def get_pipelines(self, workspace_slug: str, repo_slug: str) -> list[dict]:
         start_date = (
             datetime.utcnow() - timedelta(days=int(self.config.integration.properties["daysOfHistory"]))
         ).isoformat()
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            try:
-                response = await make_request(
-                    session,
-                    "GET",
-                    f"{self.url}/repositories/{workspace_slug}/{repo_slug}/pipelines",
-                    headers=self.headers,
-                    params=[("q", f"created_on>={start_date}Z")],
-                )
-                pipelines = response["values"]
-            except ClientResponseError as e:
-                raise Exception(f"Client server integration API error: {e.status} {e.message}")
+        try:
+            response = await make_request(
+                self.session,
+                "GET",
+                f"{self.url}/repositories/{workspace_slug}/{repo_slug}/pipelines",
+                headers=self.headers,
+                params=[("q", f"created_on>={start_date}Z")],
+            )
+            pipelines = response["values"]
+        except ClientResponseError as e:
+            raise Exception(f"Client server integration API error: {e.status} {e.message}")
         return pipelines
 
     async def get_environments(self, workspace_slug: str, repo_slug: str) -> list[dict]:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            try:
-                response = await make_request(
-                    session,
-                    "GET",
-                    f"{self.url}/repositories/{workspace_slug}/{repo_slug}/environments",
-                    headers=self.headers,
-                )
-                environments = response["values"]
-            except ClientResponseError as e:
-                raise Exception(f"Client server integration API error: {e.status} {e.message}")
+        try:
+            response = await make_request(
+                self.session,
+                "GET",
+                f"{self.url}/repositories/{workspace_slug}/{repo_slug}/environments",
+                headers=self.headers,
+            )
+            environments = response["values"]
+        except ClientResponseError as e:
+            raise Exception(f"Client server integration API error: {e.status} {e.message}")
         return environments
 
     async def get_deployments(self, workspace_slug: str, repo_slug: str) -> list[dict]:
         start_date = (
             datetime.utcnow() - timedelta(days=int(self.config.integration.properties["daysOfHistory"]))
         ).isoformat()
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            try:
-                response = await make_request(
-                    session,
-                    "GET",
-                    f"{self.url}/repositories/{workspace_slug}/{repo_slug}/deployments",
-                    headers=self.headers,
-                    params=[("q", f"created_on>={start_date}Z")],
-                )
-                deployments = response["values"]
-            except ClientResponseError as e:
-                raise Exception(f"Client server integration API error: {e.status} {e.message}")
+        try:
+            response = await make_request(
+                self.session,
+                "GET",
+                f"{self.url}/repositories/{workspace_slug}/{repo_slug}/deployments",
+                headers=self.headers,
+                params=[("q", f"created_on>={start_date}Z")],
+            )
+            deployments = response["values"]
+        except ClientResponseError as e:
+            raise Exception(f"Client server integration API error: {e.status} {e.message}")
         return deployments
@@ -1,3 +1,5 @@
+from types import TracebackType
+
 from galaxy.core.galaxy import Integration, register
 from galaxy.core.models import Config
 from galaxy.integrations.bitbucket.client import BitbucketClient
@@ -20,6 +22,13 @@ class Bitbucket(Integration):
         self.workspace_repository_environments = {}
         self.workspace_repository_deployments = {}
 
+    async def __aenter__(self) -> "Bitbucket":
+        await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
+        await self.client.__aexit__(exc_type, exc, tb)
+
     async def kickstart_integration(self):
         await self.client.init_credentials()
 
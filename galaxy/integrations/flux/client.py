@@ -1,6 +1,6 @@
-import datetime
 import functools
 import itertools
+from collections.abc import Callable
 from types import TracebackType
 from typing import Any
 
@@ -8,19 +8,10 @@ from kubernetes import client as k8s_client, config as k8s_config
 from kubernetes.client import ApiClient
 from kubernetes.config.config_exception import ConfigException
 
-__all__ = ["FluxClient"]
-
+from galaxy.utils.concurrency import run_concurrently, run_in_thread
+from galaxy.utils.serializers import json_deserialize
 
-def encode_dt(obj):
-    """Workaround while mapper can't handle datetime values."""
-    if isinstance(obj, datetime.datetime):
-        return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {k: encode_dt(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [encode_dt(v) for v in obj]
-    else:
-        return obj
+__all__ = ["FluxClient"]
 
 
 class FluxClient:
@@ -63,6 +54,12 @@ class FluxClient:
 
         raise RuntimeError("Unable to load kubernetes client configuration")
 
+    @staticmethod
+    def _request_json(func: Callable[..., Any], *args: Any, **kwargs: Any) -> dict:
+        # The raw response is decoded as is, without the kubernetes models (and their datetime values) round-trip
+        response = func(*args, **kwargs, _preload_content=False)
+        return json_deserialize(response.data)
+
     async def _fetch_list_data(
         self, api_instance: k8s_client.CoreV1Api | k8s_client.CustomObjectsApi, method: str, *args: Any, **kwargs: Any
     ) -> list[dict]:
@@ -71,14 +68,13 @@ class FluxClient:
 
         items, _continue = [], None
         while True:
-            response = func() if not _continue else func(_continue=_continue)
-
-            if isinstance(response, dict):
-                _continue = response["metadata"]["continue"]
+            # The kubernetes client is blocking: requests run in worker threads
+            if not _continue:
+                response = await run_in_thread(self._request_json, func)
             else:
-                _continue = response._metadata._continue
-                response = encode_dt(response.to_dict())
+                response = await run_in_thread(self._request_json, func, _continue=_continue)
 
+            _continue = response["metadata"].get("continue")
             items.extend(response["items"])
 
             if not _continue:
@@ -86,10 +82,16 @@ class FluxClient:
 
         return items
 
+    async def _fetch_custom_objects(self, crds: list[tuple[str, str, str]]) -> list[dict]:
+        api_instance = k8s_client.CustomObjectsApi(self.client)
+        results = await run_concurrently(
+            lambda crd: self._fetch_list_data(api_instance, "list_cluster_custom_object", *crd), crds
+        )
+        return list(itertools.chain.from_iterable(results))
+
     async def get_cluster(self) -> dict:
         api_instance = k8s_client.CoreV1Api(self.client)
-        response = api_instance.read_namespace("kube-system")
-        return encode_dt(response.to_dict())
+        return await run_in_thread(self._request_json, api_instance.read_namespace, "kube-system")
 
     async def get_namespaces(self, exclude_system: bool) -> list[dict]:
         api_instance = k8s_client.CoreV1Api(self.client)
@@ -103,7 +105,6 @@ class FluxClient:
         return filtered_namespaces
 
     async def get_sources(self) -> list[dict]:
-        api_instance = k8s_client.CustomObjectsApi(self.client)
         crds = [
             ("source.toolkit.fluxcd.io", "v1beta2", "buckets"),
             ("source.toolkit.fluxcd.io", "v1beta2", "gitrepositories"),
@@ -111,20 +112,11 @@ class FluxClient:
             ("source.toolkit.fluxcd.io", "v1beta2", "helmrepositories"),
             ("source.toolkit.fluxcd.io", "v1beta2", "ocirepositories"),
         ]
-
-        items = itertools.chain.from_iterable(
-            [await self._fetch_list_data(api_instance, "list_cluster_custom_object", *crd) for crd in crds]
-        )
-        return list(items)
+        return await self._fetch_custom_objects(crds)
 
     async def get_applications(self) -> list[dict]:
-        api_instance = k8s_client.CustomObjectsApi(self.client)
         crds = [
             ("kustomize.toolkit.fluxcd.io", "v1beta2", "kustomizations"),
             ("helm.toolkit.fluxcd.io", "v2beta2", "helmreleases"),
         ]
-
-        items = itertools.chain.from_iterable(
-            [await self._fetch_list_data(api_instance, "list_cluster_custom_object", *crd) for crd in crds]
-        )
-        return list(items)
+        return await self._fetch_custom_objects(crds)
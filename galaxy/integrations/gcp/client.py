@@ -1,11 +1,17 @@
+from collections.abc import Iterator, Sequence
+
 from google.cloud import asset_v1
 from google.oauth2 import service_account
 from google.protobuf.json_format import MessageToDict
 
+from galaxy.utils.concurrency import run_in_thread
+
 __all__ = ["GcpClient"]
 
 
 class GcpClient:
+    PAGE_SIZE: int = 1000
+
     def __init__(self, config, logger):
         self.config = config
         self.logger = logger
@@ -13,22 +19,45 @@ class GcpClient:
         self.credentials = service_account.Credentials.from_service_account_info(self.json_account_info)
         self.client = asset_v1.AssetServiceClient(credentials=self.credentials)
 
-    async def get_assets(self, asset_types):
-        assets = []
+        # Assets are listed in the project of the service account unless an organization or folder is given
+        self.scope = (
+            config.integration.properties.get("assetsScope") or f"projects/{self.json_account_info['project_id']}"
+        )
+
+    async def get_assets(self, asset_types: list[str]) -> list[dict]:
+        assets_by_type = await self.get_assets_by_type(asset_types)
+        return [asset for assets in assets_by_type.values() for asset in assets]
+
+    async def get_assets_by_type(self, asset_types: Sequence[str]) -> dict[str, list[dict]]:
+        """List the assets of all the given types in a single pass, returning them by asset type.
 
+        The Asset API is blocking: each page is fetched and converted in a worker thread.
+        """
+        assets_by_type: dict[str, list[dict]] = {asset_type: [] for asset_type in asset_types}
+
+        pages = await run_in_thread(self._list_assets_pages, asset_types)
+        while (assets := await run_in_thread(self._next_assets_page, pages)) is not None:
+            for asset in assets:
+                assets_by_type.setdefault(asset.get("assetType"), []).append(asset)
+
+        self.logger.debug(
+            "Found assets in %s: %r", self.scope, {key: len(assets) for key, assets in assets_by_type.items()}
+        )
+        return assets_by_type
+
+    def _list_assets_pages(self, asset_types: Sequence[str]) -> Iterator[asset_v1.ListAssetsResponse]:
         request = asset_v1.ListAssetsRequest(
-            parent=f"projects/{self.json_account_info['project_id']}",
+            parent=self.scope,
             read_time=None,
-            asset_types=asset_types,
+            asset_types=list(asset_types),
             content_type="RESOURCE",
-            page_size=100,
+            page_size=self.PAGE_SIZE,
         )
-        response = self.client.list_assets(request)
-        assets.extend(response)
-
-        while response._response.next_page_token != "":
-            request.page_token = response._response.next_page_token
-            response = self.client.list_assets(request)
-            assets.extend(response)
+        return iter(self.client.list_assets(request).pages)
 
-        return [MessageToDict(message=asset._pb) for asset in assets]
+    @staticmethod
+    def _next_assets_page(pages: Iterator[asset_v1.ListAssetsResponse]) -> list[dict] | None:
+        page = next(pages, None)
+        if page is None:
+            return None
+        return [MessageToDict(message=asset._pb) for asset in page.assets]
@@ -1,5 +1,6 @@
 import base64
-from collections.abc import Iterable
+import math
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from datetime import datetime, timedelta
 from functools import partial
 from itertools import count
@@ -8,9 +9,19 @@ from typing import Any, TypeAlias
 
 from github import Auth, Github
 
-from galaxy.integrations.github.queries import QueryType, build_graphql_query
+from galaxy.integrations.github.queries import QueryType, build_graphql_query, build_repository_alias
+from galaxy.utils.concurrency import run_concurrently
+from galaxy.utils.pagination import fetch_pages, fetch_pages_until
 from galaxy.utils.parsers import to_bool
-from galaxy.utils.requests import ClientSession, RequestError, RetryPolicy, create_session, make_request
+from galaxy.utils.requests import (
+    ClientSession,
+    ConnectionPolicy,
+    RequestError,
+    RetryPolicy,
+    ServerError,
+    create_session,
+    make_request,
+)
 
 __all__ = ["GithubClient"]
 
@@ -32,8 +43,22 @@ class GithubGraphQLRequestError(GithubRequestError):
     """An error occurred while making a GraphQL request with the Github Client."""
 
 
+class GithubGraphQLResourceLimitsError(GithubGraphQLRequestError):
+    """A GraphQL query exceeded the node or cost limits of the Github API."""
+
+
 class GithubClient:
     DEFAULT_DAYS_OF_HISTORY: int = 30
+    # Number of pages of a REST list fetched at the same time
+    PAGES_MAX_CONCURRENCY: int = 5
+    # Number of repositories whose details are fetched in a single GraphQL query, batches exceeding the API limits or
+    # timing out are halved
+    REPOSITORIES_BATCH_SIZE: int = 25
+    GRAPHQL_RESOURCE_LIMITS_ERROR_TYPES: frozenset[str] = frozenset(
+        {"RESOURCE_LIMITS_EXCEEDED", "MAX_NODE_LIMIT_EXCEEDED"}
+    )
+    # Maximum number of workflow runs listed for a `created` filter, whatever the page size
+    WORKFLOW_RUNS_MAX_RESULTS: int = 1000
 
     @staticmethod
     def get_access_token(
@@ -70,6 +95,7 @@ class GithubClient:
         }
         self._session: ClientSession | None = None
         self._retry_policy = RetryPolicy(logger=self.logger)
+        self._connection_policy = ConnectionPolicy.from_properties(config.integration.properties)
 
         self._days_of_history: int | None = None
 
@@ -77,7 +103,9 @@ class GithubClient:
         self.repo_activity_limit_timestamp = datetime.now() - timedelta(days=self.days_of_history * 3)
 
     async def __aenter__(self) -> "GithubClient":
-        self._session = create_session(timeout=self.timeout, headers=self._headers)
+        self._session = create_session(
+            timeout=self.timeout, headers=self._headers, connection_policy=self._connection_policy
+        )
         return self
 
     async def __aexit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
@@ -108,6 +136,19 @@ class GithubClient:
             current = current.get(key)
         return current
 
+    @staticmethod
+    def _is_graphql_query_too_large(error: GithubRequestError) -> bool:
+        if isinstance(error, GithubGraphQLResourceLimitsError):
+            return True
+
+        # The API answers with a server error (e.g. 502) when a query takes too long to resolve, or does not answer
+        cause: BaseException | None = error.__cause__
+        while cause is not None:
+            if isinstance(cause, ServerError | TimeoutError):
+                return True
+            cause = cause.__cause__ or cause.__context__
+        return False
+
     @staticmethod
     def build_repo_id(organization: str, repo: str) -> str:
         return f"{organization}/{repo}"
@@ -200,11 +241,14 @@ class GithubClient:
         if not isinstance(response, dict):
             raise GithubGraphQLRequestError("Failed to parse GraphQL response")
 
+        errors = response.get("errors") or []
+        if any(error.get("type") in self.GRAPHQL_RESOURCE_LIMITS_ERROR_TYPES for error in errors):
+            raise GithubGraphQLResourceLimitsError(f"GraphQL query exceeded the API limits: {errors}")
+
         data = response.get("data")
         if data is None:
             raise GithubGraphQLRequestError("Failed to parse GraphQL data")
 
-        errors = response.get("errors") or []
         if errors:
             if raise_on_organization_not_found and any(self.is_error_not_found_organization(error) for error in errors):
                 raise GithubGraphQLRequestError("Organization not found")
@@ -212,6 +256,39 @@ class GithubClient:
 
         return data, errors
 
+    async def _get_rest_list(self, url: str, key: str) -> list[dict[str, Any]]:
+        """Get all the items of a paginated REST list, fetching the pages after the first one concurrently."""
+
+        async def _get_page(page_num: int) -> dict[str, Any] | None:
+            return await self._make_request("GET", url, params={"page": page_num, "per_page": self.page_size})
+
+        def _is_last_page(response: dict[str, Any] | None) -> bool:
+            return response is None or len(response.get(key) or []) < self.page_size
+
+        first_response = await _get_page(1)
+        if _is_last_page(first_response):
+            responses = [first_response]
+        elif "total_count" in first_response:
+            page_count = math.ceil(first_response["total_count"] / self.page_size)
+            responses = [
+                first_response,
+                *await fetch_pages(_get_page, range(2, page_count + 1), max_concurrency=self.PAGES_MAX_CONCURRENCY),
+            ]
+        else:
+            responses = [
+                first_response,
+                *await fetch_pages_until(
+                    _get_page, _is_last_page, first_page=2, max_concurrency=self.PAGES_MAX_CONCURRENCY
+                ),
+            ]
+
+        items = []
+        for response in responses:
+            if response is None:
+                break
+            items.extend(response.get(key) or [])
+        return items
+
     async def get_repos(
         self, *, limit: int | None = None, ignore_archived: bool = True, ignore_old: bool = True, page_size: int = 50
     ) -> list:
@@ -239,13 +316,38 @@ class GithubClient:
 
         return repos_list
 
-    async def get_repo(self, organization: str, repo: str) -> dict[str, Any]:
-        query = build_graphql_query(query_type=QueryType.REPOSITORY, repo_id=self.build_repo_id(organization, repo))
-        data, errors = await self._make_graphql_request(query)
-        repository = self.safe_get(data, "repository")
-        if repository is None:
-            raise GithubClientError(f"Failed to get repository {organization}/{repo}: {errors}")
-        return repository
+    async def get_repos_content(self, repos: Sequence[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Get the details of many `(organization, repo)` repositories with a single query, in the same order.
+
+        Queries exceeding the API limits or timing out are split in two until they succeed or only one repository is
+        left.
+        """
+        query = build_graphql_query(
+            query_type=QueryType.REPOSITORIES,
+            repo_ids=[self.build_repo_id(organization, repo) for organization, repo in repos],
+        )
+        try:
+            data, errors = await self._make_graphql_request(query)
+        except GithubRequestError as e:
+            if len(repos) <= 1 or not self._is_graphql_query_too_large(e):
+                raise
+
+            half = len(repos) // 2
+            self.logger.warning("GraphQL query of %d repositories too large, splitting it: %s", len(repos), e)
+            return [*await self.get_repos_content(repos[:half]), *await self.get_repos_content(repos[half:])]
+
+        repositories, failures = [], []
+        for index, (organization, repo) in enumerate(repos):
+            alias = build_repository_alias(index)
+            repository = self.safe_get(data, alias)
+            if repository is None:
+                repo_errors = [error for error in errors if (error.get("path") or [None])[0] == alias]
+                failures.append(f"{organization}/{repo}: {repo_errors}")
+            repositories.append(repository)
+
+        if failures:
+            raise GithubClientError(f"Failed to get repositories {'; '.join(failures)}")
+        return repositories
 
     async def get_pull_requests(self, organization: str, repo: str, states: list[str]) -> list[dict[str, Any]]:
         all_pull_requests = []
@@ -308,60 +410,71 @@ class GithubClient:
         return all_issues
 
     async def get_workflows(self, organization: str, repo: str) -> list[dict[str, Any]]:
-        all_workflows = []
-
         url = f"{self.base_url}/repos/{organization}/{repo}/actions/workflows"
-        for page_num in count(start=1):
-            response = await self._make_request("GET", url, params={"page": page_num, "per_page": self.page_size})
-            if response is None:
-                break
+        return await self._get_rest_list(url, "workflows")
 
-            workflows = response.get("workflows")
-            if not workflows:
-                break
-            all_workflows.extend(workflows)
+    async def get_repository_workflow_runs(self, organization: str, repo: str) -> list[dict[str, Any]]:
+        """Get the runs of all the workflows of a repository created within the days of history, newest first.
 
-        return all_workflows
+        The API lists at most `WORKFLOW_RUNS_MAX_RESULTS` runs for a `created` filter, so the history is split into
+        smaller creation windows until each one fits.
+        """
+        url = f"{self.base_url}/repos/{organization}/{repo}/actions/runs"
+        return await self._get_workflow_runs_created_between(
+            url, self.history_limit_timestamp.replace(microsecond=0), datetime.now().replace(microsecond=0)
+        )
 
-    async def get_workflow_runs(self, organization: str, repo: str, workflow_id: str) -> list[dict[str, Any]]:
-        all_workflow_runs = []
+    async def _get_workflow_runs_created_between(
+        self, url: str, created_from: datetime, created_to: datetime
+    ) -> list[dict[str, Any]]:
+        # Both bounds are included, to the second
+        created = f"{created_from.isoformat()}..{created_to.isoformat()}"
 
-        url = f"{self.base_url}/repos/{organization}/{repo}/actions/workflows/{workflow_id}/runs"
-        for page_num in count(start=1):
-            response = await self._make_request(
-                "GET",
-                url,
-                params={
-                    "page": page_num,
-                    "per_page": self.page_size,
-                    "created": f">{self.history_limit_timestamp.isoformat()}",
-                },
+        async def _get_page(page_num: int) -> dict[str, Any] | None:
+            return await self._make_request(
+                "GET", url, params={"page": page_num, "per_page": self.page_size, "created": created}
             )
-            if response is None:
-                break
 
-            workflow_runs = response.get("workflow_runs", [])
-            if not workflow_runs:
-                break
-            all_workflow_runs.extend(workflow_runs)
+        first_response = await _get_page(1)
+        if first_response is None:
+            return []
 
-        return all_workflow_runs
+        total_count = first_response.get("total_count", 0)
+        if total_count > self.WORKFLOW_RUNS_MAX_RESULTS:
+            half_seconds = int((created_to - created_from).total_seconds()) // 2
+            if half_seconds >= 1:
+                created_middle = created_from + timedelta(seconds=half_seconds)
+                windows = [(created_middle + timedelta(seconds=1), created_to), (created_from, created_middle)]
+                windows_runs = await run_concurrently(
+                    lambda window: self._get_workflow_runs_created_between(url, *window), windows
+                )
+                return [run for window_runs in windows_runs for run in window_runs]
 
-    async def get_workflow_run_jobs(self, organization: str, repo: str, run_id: str) -> list[Any]:
-        all_jobs = []
+            self.logger.warning(
+                "Cannot split the %d workflow runs of %s created at %s: only the first %d are listed",
+                total_count,
+                url,
+                created_from.isoformat(),
+                self.WORKFLOW_RUNS_MAX_RESULTS,
+            )
+            total_count = self.WORKFLOW_RUNS_MAX_RESULTS
 
-        url = f"{self.base_url}/repos/{organization}/{repo}/actions/runs/{run_id}/jobs"
-        for page_num in count(start=1):
-            response = await self._make_request("GET", url, params={"page": page_num, "per_page": self.page_size})
-            if response is None:
-                break
+        page_count = math.ceil(total_count / self.page_size)
+        responses = [
+            first_response,
+            *await fetch_pages(_get_page, range(2, page_count + 1), max_concurrency=self.PAGES_MAX_CONCURRENCY),
+        ]
 
-            workflow_jobs = response.get("jobs", [])
-            if not workflow_jobs:
+        workflow_runs = []
+        for response in responses:
+            if response is None:
                 break
-            all_jobs.extend(workflow_jobs)
+            workflow_runs.extend(response.get("workflow_runs") or [])
+        return workflow_runs
 
-        return all_jobs
+    async def get_workflow_run_jobs(self, organization: str, repo: str, run_id: str) -> list[Any]:
+        url = f"{self.base_url}/repos/{organization}/{repo}/actions/runs/{run_id}/jobs"
+        return await self._get_rest_list(url, "jobs")
 
     async def get_members(self, organization: str) -> list[dict[str, Any]]:
         all_members = []
@@ -384,7 +497,12 @@ class GithubClient:
 
         return all_members
 
-    async def get_teams(self, organization: str) -> list[dict]:
+    async def get_teams(self, organization: str, *, max_concurrency: int = 1) -> list[dict]:
+        """Get the teams with their members and repositories.
+
+        The first page of members and repositories comes with each team, the remaining pages are only fetched for
+        the teams that have more of them, up to `max_concurrency` teams at a time.
+        """
         all_teams = []
         cursor = None
         while True:
@@ -396,13 +514,6 @@ class GithubClient:
             if not teams:
                 break
 
-            for team in teams:
-                name = team["name"]
-                team["members"] = {"nodes": []}
-                team["members"]["nodes"] = await self.get_team_members(organization, name)
-                team["repositories"] = {"nodes": []}
-                team["repositories"]["nodes"] = await self.get_team_repositories(organization, name)
-
             all_teams.extend(teams)
 
             page_info = self.safe_get(data, "organization", "teams", "pageInfo")
@@ -411,11 +522,30 @@ class GithubClient:
 
             cursor = page_info["endCursor"]
 
+        async def _get_next_pages(team: dict, connection: str, get_nodes: Callable[..., Awaitable[list[dict]]]) -> None:
+            page_info = team[connection]["pageInfo"]
+            team[connection]["nodes"].extend(await get_nodes(organization, team["slug"], after=page_info["endCursor"]))
+
+        next_pages = [
+            (team, connection, get_nodes)
+            for team in all_teams
+            for connection, get_nodes in (
+                ("members", self.get_team_members),
+                ("repositories", self.get_team_repositories),
+            )
+            if team[connection]["pageInfo"]["hasNextPage"]
+        ]
+        await run_concurrently(lambda args: _get_next_pages(*args), next_pages, max_concurrency=max_concurrency)
+
+        for team in all_teams:
+            team["members"] = {"nodes": team["members"]["nodes"]}
+            team["repositories"] = {"nodes": team["repositories"]["nodes"]}
+
         return all_teams
 
-    async def get_team_members(self, organization: str, team_id: str) -> list[dict]:
+    async def get_team_members(self, organization: str, team_id: str, *, after: str | None = None) -> list[dict]:
         all_members = []
-        cursor = None
+        cursor = after
         while True:
             query = build_graphql_query(
                 query_type=QueryType.TEAM_MEMBERS,
@@ -439,9 +569,9 @@ class GithubClient:
 
         return all_members
 
-    async def get_team_repositories(self, organization: str, team_id: str) -> list[dict]:
+    async def get_team_repositories(self, organization: str, team_id: str, *, after: str | None = None) -> list[dict]:
         all_repositories = []
-        cursor = None
+        cursor = after
         while True:
             query = build_graphql_query(
                 query_type=QueryType.TEAM_REPOS,
@@ -466,20 +596,8 @@ class GithubClient:
         return all_repositories
 
     async def get_environments(self, organization: str, repo: str) -> list[dict[str, Any]]:
-        all_environments = []
-
         url = f"{self.config.integration.properties['url']}/repos/{organization}/{repo}/environments"
-        for page_num in count(start=1):
-            response = await self._make_request("GET", url, params={"page": page_num, "per_page": self.page_size})
-            if response is None:
-                break
-
-            environments = response.get("environments", [])
-            if not environments:
-                break
-            all_environments.extend(environments)
-
-        return all_environments
+        return await self._get_rest_list(url, "environments")
 
     async def get_deployments(
         self, organization: str, repo: str, environments: Iterable[str] | None = None
@@ -1,3 +1,5 @@
+from collections import defaultdict
+from collections.abc import AsyncGenerator
 from types import TracebackType
 
 from galaxy.core.galaxy import Integration, register
@@ -11,6 +13,8 @@ from galaxy.integrations.github.utils import (
     get_inactive_usernames_from_workflow_runs,
     map_users_to_teams,
 )
+from galaxy.utils.concurrency import get_api_max_concurrency, run_concurrently
+from galaxy.utils.itertools import chunks
 
 __all__ = ["Github"]
 
@@ -24,6 +28,10 @@ class Github(Integration):
     PULL_REQUEST_STATUS_TO_FETCH = ["OPEN", "CLOSED", "MERGED"]
     ISSUE_STATUS_TO_FETCH = ["open", "closed"]
 
+    DEFAULT_API_MAX_CONCURRENCY: int = 10
+    # Number of repositories crawled before yielding their entities in streaming methods
+    STREAMING_REPOSITORIES_BATCH_SIZE: int = 50
+
     # Default Group for previous members of the organization
     template_inactive_members_team = {
         "databaseId": "former-github-members",
@@ -74,6 +82,12 @@ class Github(Integration):
     def is_organization_owner(self) -> bool:
         return self._owner_type == "Organization"
 
+    @property
+    def api_max_concurrency(self) -> int:
+        return get_api_max_concurrency(
+            self.config.integration.properties, self.DEFAULT_API_MAX_CONCURRENCY, self.logger
+        )
+
     @register(_methods, group=0)
     async def owner(self) -> None:
         repo = await self.client.get_repos(limit=1, ignore_archived=False, ignore_old=False)
@@ -97,8 +111,21 @@ class Github(Integration):
             page_size=self.client.page_size,
         )
 
-        for metadata in repositories_metadata:
-            content = await self.client.get_repo(metadata["owner"]["login"], metadata["name"])
+        self.logger.debug(
+            "Fetching %d repositories (max concurrency: %d)", len(repositories_metadata), self.api_max_concurrency
+        )
+        # Repository details are fetched in batches, each one with a single GraphQL query
+        batches = list(chunks(repositories_metadata, self.client.REPOSITORIES_BATCH_SIZE))
+        batches_contents = await run_concurrently(
+            lambda batch: self.client.get_repos_content(
+                [(metadata["owner"]["login"], metadata["name"]) for metadata in batch]
+            ),
+            batches,
+            max_concurrency=self.api_max_concurrency,
+        )
+        contents = [content for batch_contents in batches_contents for content in batch_contents]
+
+        for metadata, content in zip(repositories_metadata, contents):
             self.repositories[metadata["id"]] = {
                 "id": metadata["id"],
                 "slug": metadata["name"],
@@ -123,7 +150,8 @@ class Github(Integration):
             self.logger.warning("Cannot fetch teams: owner is not an organization")
             return []
 
-        self.teams = {team["databaseId"]: team for team in (await self.client.get_teams(self._owner))}
+        teams = await self.client.get_teams(self._owner, max_concurrency=self.api_max_concurrency)
+        self.teams = {team["databaseId"]: team for team in teams}
         self.teams[self.template_inactive_members_team["databaseId"]] = self.template_inactive_members_team
 
         for team_id, team in self.teams.items():
@@ -161,38 +189,44 @@ class Github(Integration):
         return members_mapped
 
     @register(_methods, group=4)
-    async def pull_request(self) -> list[dict]:
+    async def pull_request(self) -> AsyncGenerator[list[dict], None]:
         if self._owner is None:
             self.logger.warning("Cannot fetch pull requests: owner not found")
-            return []
+            return
 
-        prs_mapped = []
-        inactive_usernames = set()
-        for repo_id, repo in self.repositories.items():
-            self.repository_to_pull_requests[repo_id] = await self.client.get_pull_requests(
+        async def _get_pull_requests(repo: dict) -> tuple[list[dict], list[dict]]:
+            pull_requests = await self.client.get_pull_requests(
                 repo["owner"], repo["slug"], self.PULL_REQUEST_STATUS_TO_FETCH
             )
-
-            prs_mapped.extend(
-                (
-                    await self.mapper.process(
-                        "pull_request",
-                        self.repository_to_pull_requests[repo_id],
-                        context={"repositoryId": repo["id"], "repositoryName": repo["slug"]},
-                    )
-                )
-            )
-
-            inactive_usernames.update(
-                get_inactive_usernames_from_pull_requests(self.repository_to_pull_requests[repo_id], self.users)
+            prs_mapped = await self.mapper.process(
+                "pull_request", pull_requests, context={"repositoryId": repo["id"], "repositoryName": repo["slug"]}
             )
-
-        self.logger.info(f"Found {len(prs_mapped)} pull requests from the last {self.client.days_of_history} days")
-        new_entities = await self.register_inactive_users(inactive_usernames)
-        if new_entities:
-            self.logger.info(f"Found {len(new_entities) - 1} inactive members associated to pull requests")
-
-        return new_entities + prs_mapped
+            return pull_requests, prs_mapped
+
+        # Pull requests are yielded per batch of repositories so they can be pushed while the remaining repositories
+        # are crawled. The inactive members they mention are yielded before them so they exist once the batch is pushed
+        prs_count = 0
+        inactive_members_count = 0
+        for repos in chunks(list(self.repositories.values()), self.STREAMING_REPOSITORIES_BATCH_SIZE):
+            prs_mapped = []
+            inactive_usernames = set()
+            for pull_requests, repo_prs_mapped in await run_concurrently(
+                _get_pull_requests, repos, max_concurrency=self.api_max_concurrency
+            ):
+                inactive_usernames.update(get_inactive_usernames_from_pull_requests(pull_requests, self.users))
+                prs_mapped.extend(repo_prs_mapped)
+
+            new_entities = await self.register_inactive_users(inactive_usernames)
+            if new_entities:
+                inactive_members_count += len(new_entities) - 1
+                yield new_entities
+
+            prs_count += len(prs_mapped)
+            yield prs_mapped
+
+        self.logger.info(f"Found {prs_count} pull requests from the last {self.client.days_of_history} days")
+        if inactive_members_count:
+            self.logger.info(f"Found {inactive_members_count} inactive members associated to pull requests")
 
     # Disabled
     async def issue(self) -> list[dict]:
@@ -227,18 +261,18 @@ class Github(Integration):
             self.logger.warning("Cannot fetch workflows: owner not found")
             return []
 
-        workflows_mapped = []
-
-        for repo_id, repo in self.repositories.items():
-            self.repository_to_workflows[repo_id] = await self.client.get_workflows(repo["owner"], repo["slug"])
-            workflows_mapped.extend(
-                (
-                    await self.mapper.process(
-                        "workflow", self.repository_to_workflows[repo_id], context={"repositoryId": repo_id}
-                    )
-                )
+        async def _get_workflows(repo: dict) -> list[dict]:
+            self.repository_to_workflows[repo["id"]] = await self.client.get_workflows(repo["owner"], repo["slug"])
+            return await self.mapper.process(
+                "workflow", self.repository_to_workflows[repo["id"]], context={"repositoryId": repo["id"]}
             )
 
+        workflows_mapped = []
+        for repo_workflows_mapped in await run_concurrently(
+            _get_workflows, list(self.repositories.values()), max_concurrency=self.api_max_concurrency
+        ):
+            workflows_mapped.extend(repo_workflows_mapped)
+
         self.logger.info(f"Found {len(workflows_mapped)} workflows from the last {self.client.days_of_history} days")
         return workflows_mapped
 
@@ -248,26 +282,34 @@ class Github(Integration):
             self.logger.warning("Cannot fetch workflow runs: owner not found")
             return []
 
-        workflows_runs_mapped = []
-        inactive_usernames = set()
-        for repo_id, repo in self.repositories.items():
-            for workflow in self.repository_to_workflows.get(repo_id) or []:
-                self.workflows_to_runs[repo_id] = await self.client.get_workflow_runs(
-                    repo["owner"], repo["slug"], workflow["id"]
-                )
-                workflows_runs_mapped.extend(
-                    (
-                        await self.mapper.process(
-                            "workflow_run",
-                            self.workflows_to_runs[repo_id],
-                            context={"repositoryId": repo_id, "workflow": workflow},
-                        )
+        async def _get_workflow_runs(repo: dict) -> tuple[list[dict], list[dict]]:
+            # All the runs of the repository are fetched at once and grouped by workflow
+            workflows_runs = defaultdict(list)
+            for run in await self.client.get_repository_workflow_runs(repo["owner"], repo["slug"]):
+                workflows_runs[run["workflow_id"]].append(run)
+
+            runs, runs_mapped = [], []
+            for workflow in self.repository_to_workflows.get(repo["id"]) or []:
+                self.workflows_to_runs[workflow["id"]] = workflows_runs.get(workflow["id"], [])
+                runs.extend(self.workflows_to_runs[workflow["id"]])
+                runs_mapped.extend(
+                    await self.mapper.process(
+                        "workflow_run",
+                        self.workflows_to_runs[workflow["id"]],
+                        context={"repositoryId": repo["id"], "workflow": workflow},
                     )
                 )
+            return runs, runs_mapped
 
-                inactive_usernames.update(
-                    get_inactive_usernames_from_workflow_runs(self.workflows_to_runs[repo_id], self.users)
-                )
+        repos = [repo for repo_id, repo in self.repositories.items() if self.repository_to_workflows.get(repo_id)]
+
+        workflows_runs_mapped = []
+        inactive_usernames = set()
+        for workflow_runs, workflow_runs_mapped in await run_concurrently(
+            _get_workflow_runs, repos, max_concurrency=self.api_max_concurrency
+        ):
+            workflows_runs_mapped.extend(workflow_runs_mapped)
+            inactive_usernames.update(get_inactive_usernames_from_workflow_runs(workflow_runs, self.users))
         self.logger.info(
             "Found %d workflow runs from the last %d days", len(workflows_runs_mapped), self.client.days_of_history
         )
@@ -283,17 +325,19 @@ class Github(Integration):
             self.logger.warning("Cannot fetch environments: owner not found")
             return []
 
-        environments_mapped = []
-
-        for repo_id, repo in self.repositories.items():
-            self.repository_to_environments[repo_id] = await self.client.get_environments(repo["owner"], repo["slug"])
-            environments_mapped.extend(
-                (
-                    await self.mapper.process(
-                        "environment", self.repository_to_environments[repo_id], context={"repositoryId": repo_id}
-                    )
-                )
+        async def _get_environments(repo: dict) -> list[dict]:
+            self.repository_to_environments[repo["id"]] = await self.client.get_environments(
+                repo["owner"], repo["slug"]
             )
+            return await self.mapper.process(
+                "environment", self.repository_to_environments[repo["id"]], context={"repositoryId": repo["id"]}
+            )
+
+        environments_mapped = []
+        for repo_environments_mapped in await run_concurrently(
+            _get_environments, list(self.repositories.values()), max_concurrency=self.api_max_concurrency
+        ):
+            environments_mapped.extend(repo_environments_mapped)
 
         self.logger.info(f"Found {len(environments_mapped)} environments")
         return environments_mapped
@@ -304,32 +348,37 @@ class Github(Integration):
             self.logger.warning("Cannot fetch deployments: owner not found")
             return []
 
-        deployments_mapped = []
-        inactive_usernames = set()
-        for repo_id, repo in self.repositories.items():
-            self.repository_to_deployments[repo_id] = []
-            for environment in self.repository_to_environments.get(repo_id) or []:
-                repo_env_deployments = await self.client.get_deployments(
-                    repo["owner"], repo["slug"], [environment["name"]]
-                )
+        async def _get_deployments(repo_environment: tuple[dict, dict]) -> tuple[list[dict], list[dict]]:
+            repo, environment = repo_environment
+            repo_env_deployments = await self.client.get_deployments(repo["owner"], repo["slug"], [environment["name"]])
+            repo_env_deployments_mapped = await self.mapper.process(
+                "deployment",
+                repo_env_deployments,
+                context={
+                    "repositoryId": repo["id"],
+                    "repositoryName": repo["slug"],
+                    "repositoryLink": repo["link"],
+                    "environmentId": environment["id"],
+                },
+            )
+            return repo_env_deployments, repo_env_deployments_mapped
 
-                self.repository_to_deployments[repo_id].extend(repo_env_deployments)
-                deployments_mapped.extend(
-                    (
-                        await self.mapper.process(
-                            "deployment",
-                            repo_env_deployments,
-                            context={
-                                "repositoryId": repo_id,
-                                "repositoryName": repo["slug"],
-                                "repositoryLink": repo["link"],
-                                "environmentId": environment["id"],
-                            },
-                        )
-                    )
-                )
+        repos_environments = [
+            (repo, environment)
+            for repo_id, repo in self.repositories.items()
+            for environment in self.repository_to_environments.get(repo_id) or []
+        ]
 
-                inactive_usernames.update(get_inactive_usernames_from_deployments(repo_env_deployments, self.users))
+        deployments_mapped = []
+        inactive_usernames = set()
+        self.repository_to_deployments = {repo_id: [] for repo_id in self.repositories}
+        for (repo, _), (repo_env_deployments, repo_env_deployments_mapped) in zip(
+            repos_environments,
+            await run_concurrently(_get_deployments, repos_environments, max_concurrency=self.api_max_concurrency),
+        ):
+            self.repository_to_deployments[repo["id"]].extend(repo_env_deployments)
+            deployments_mapped.extend(repo_env_deployments_mapped)
+            inactive_usernames.update(get_inactive_usernames_from_deployments(repo_env_deployments, self.users))
 
         self.logger.info(f"Found {len(deployments_mapped)} deployments")
 
@@ -345,14 +394,18 @@ class Github(Integration):
             self.logger.warning("Cannot fetch repository metrics: owner not found")
             return []
 
-        all_metrics = []
-        for repo in self.repositories.values():
+        async def _get_repository_metrics(repo: dict) -> list[dict]:
             commits = await self.client.get_commits(repo["owner"], repo["slug"], branch=repo["default_branch"])
-            repository_metrics = await self.mapper.process(
+            return await self.mapper.process(
                 "repository_metrics",
                 [{"commits": commits}],
                 context={"repositoryId": repo["id"], "repositoryName": repo["slug"]},
             )
+
+        all_metrics = []
+        for repository_metrics in await run_concurrently(
+            _get_repository_metrics, list(self.repositories.values()), max_concurrency=self.api_max_concurrency
+        ):
             all_metrics.extend(repository_metrics)
 
         self.logger.info(
@@ -3,7 +3,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-__all__ = ["QueryType", "build_graphql_query"]
+__all__ = ["QueryType", "build_graphql_query", "build_repository_alias"]
 
 
 class QueryType(str, Enum):
@@ -25,6 +25,7 @@ def build_graphql_query(query_type: QueryType, **params: Any) -> dict:
         QueryType.PULL_REQUESTS: _build_pull_requests_query,
         QueryType.DEPLOYMENTS: _build_deployments_query,
         QueryType.REPOSITORY: _build_repository_query,
+        QueryType.REPOSITORIES: _build_repositories_query,
         QueryType.MEMBERS: _build_members_query,
         QueryType.TEAMS: _build_teams_query,
         QueryType.TEAM_MEMBERS: _build_team_members,
@@ -281,79 +282,89 @@ def _build_deployments_query(
     return query, variables
 
 
-def _build_repository_query(repo_id: str) -> tuple[str, dict[str, Any]]:
-    query = """
-        query GetRepo($owner: String!, $name: String!) {
-            repository(owner: $owner, name: $name, followRenames: true) {
-                name
-                url
-                description
-                createdAt
-                updatedAt
-                isPrivate
-                languages(first: 100) {
-                  edges {
-                    node {
-                      name
-                    }
-                  }
-                }
-                defaultBranchRef {
+REPOSITORY_FRAGMENT = """
+        fragment RepositoryFields on Repository {
+            name
+            url
+            description
+            createdAt
+            updatedAt
+            isPrivate
+            languages(first: 100) {
+              edges {
+                node {
                   name
-                  target {
-                    ... on Commit {
-                      file(path: "README.md") {
-                        object {
-                          ... on Blob {
-                            text
-                          }
-                        }
+                }
+              }
+            }
+            defaultBranchRef {
+              name
+              target {
+                ... on Commit {
+                  file(path: "README.md") {
+                    object {
+                      ... on Blob {
+                        text
                       }
                     }
                   }
                 }
-                primaryLanguage {
-                  name
-                }
-                totalPullRequests: pullRequests {
-                  totalCount
-                }
-                openPullRequests: pullRequests(states: OPEN) {
-                  totalCount
-                }
-                issues: issues {
-                  totalCount
-                }
-                openIssues: issues(states: OPEN) {
-                  totalCount
-                }
-                owner {
-                  login
-                }
-                codeOwners: object(expression: "HEAD:.github/CODEOWNERS") {
-                  ... on Blob {
-                    text
-                  }
-                }
-                lastCommits: defaultBranchRef {
-                  target {
-                    ... on Commit {
-                      history(first: 5) {
-                        nodes {
-                          oid
-                          message
-                          author {
-                            name
-                            date
-                          }
-                        }
+              }
+            }
+            primaryLanguage {
+              name
+            }
+            totalPullRequests: pullRequests {
+              totalCount
+            }
+            openPullRequests: pullRequests(states: OPEN) {
+              totalCount
+            }
+            issues: issues {
+              totalCount
+            }
+            openIssues: issues(states: OPEN) {
+              totalCount
+            }
+            owner {
+              login
+            }
+            codeOwners: object(expression: "HEAD:.github/CODEOWNERS") {
+              ... on Blob {
+                text
+              }
+            }
+            lastCommits: defaultBranchRef {
+              target {
+                ... on Commit {
+                  history(first: 5) {
+                    nodes {
+                      oid
+                      message
+                      author {
+                        name
+                        date
                       }
                     }
                   }
                 }
+              }
+            }
+        }
+"""
+
+
+def _build_repository_query(repo_id: str) -> tuple[str, dict[str, Any]]:
+    query = (
+        """
+        query GetRepo($owner: String!, $name: String!) {
+            repository(owner: $owner, name: $name, followRenames: true) {
+                ...RepositoryFields
             }
         }
     """
+        + REPOSITORY_FRAGMENT
+    )
 
     owner, name = repo_id.split("/", maxsplit=1)
 
@@ -361,6 +372,27 @@ def _build_repository_query(repo_id: str) -> tuple[str, dict[str, Any]]:
     return query, variables
 
 
+def build_repository_alias(index: int) -> str:
+    return f"repository{index}"
+
+
+def _build_repositories_query(repo_ids: Iterable[str]) -> tuple[str, dict[str, Any]]:
+    """Build a query for the details of many repositories, each one under the alias of its index."""
+    arguments, selections, variables = [], [], {}
+    for index, repo_id in enumerate(repo_ids):
+        owner, name = repo_id.split("/", maxsplit=1)
+        alias = build_repository_alias(index)
+
+        arguments.append(f"$owner{index}: String!, $name{index}: String!")
+        selections.append(
+            f"{alias}: repository(owner: $owner{index}, name: $name{index}, followRenames: true) {{ ...RepositoryFields }}"
+        )
+        variables |= {f"owner{index}": owner, f"name{index}": name}
+
+    query = "query GetRepos(" + ", ".join(arguments) + ") {\n" + "\n".join(selections) + "\n}\n" + REPOSITORY_FRAGMENT
+    return query, variables
+
+
 def _build_teams_query(owner: str, after: Optional[str] = None, page_size: int = 50) -> tuple[str, dict[str, str]]:
     query = """
         query OrganizationInfo(
@@ -377,8 +409,33 @@ def _build_teams_query(owner: str, after: Optional[str] = None, page_size: int =
                     nodes {
                         databaseId
                         name
+                        slug
                         description
                         url
+                        members(first: $pageSize) {
+                            nodes {
+                                databaseId
+                                login
+                                createdAt
+                                updatedAt
+                                url
+                                email
+                            }
+                            pageInfo {
+                                endCursor
+                                hasNextPage
+                            }
+                        }
+                        repositories(first: $pageSize) {
+                            nodes {
+                                databaseId
+                                name
+                            }
+                            pageInfo {
+                                endCursor
+                                hasNextPage
+                            }
+                        }
                     }
                 }
             }
@@ -8,7 +8,7 @@ from aiohttp import ClientResponseError, ClientSession
 from galaxy.core.models import Config
 from galaxy.integrations.gitlab.queries import Queries
 from galaxy.utils.parsers import to_bool
-from galaxy.utils.requests import RetryPolicy, create_session, make_request
+from galaxy.utils.requests import ConnectionPolicy, RetryPolicy, create_session, make_request
 
 __all__ = ["GitlabClient"]
 
@@ -46,9 +46,12 @@ class GitlabClient:
 
         self.session: ClientSession | None = None
         self.retry_policy = RetryPolicy(logger=self.logger, wait_multiplier=2, wait_min=60, wait_max=120)
+        self.connection_policy = ConnectionPolicy.from_properties(config.integration.properties)
 
     async def __aenter__(self) -> "GitlabClient":
-        self.session = create_session(timeout=self.timeout, headers=self.headers)
+        self.session = create_session(
+            timeout=self.timeout, headers=self.headers, connection_policy=self.connection_policy
+        )
         return self
 
     async def __aexit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
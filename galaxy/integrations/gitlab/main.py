@@ -18,7 +18,7 @@ from galaxy.integrations.gitlab.utils import (
     get_required_reviews,
     map_users_to_groups,
 )
-from galaxy.utils.concurrency import task_group_run_with_semaphore
+from galaxy.utils.concurrency import get_api_max_concurrency, task_group_run_with_semaphore
 
 __all__ = ["Gitlab"]
 
@@ -75,12 +75,9 @@ class Gitlab(Integration):
 
     @property
     def api_max_concurrency(self) -> int:
-        value = int(self.config.integration.properties.get("apiMaxConcurrency", self.DEFAULT_API_MAX_CONCURRENCY))
-        if value < 1:
-            self.logger.warning("Invalid apiMaxConcurrency: %d. Disabling concurrency", value)
-            return 1
-
-        return value
+        return get_api_max_concurrency(
+            self.config.integration.properties, self.DEFAULT_API_MAX_CONCURRENCY, self.logger
+        )
 
     @property
     def repo_files_to_check(self) -> list[dict]:
@@ -4,13 +4,16 @@ from types import TracebackType
 from typing import Any
 
 from galaxy.core.models import Config
-from galaxy.utils.requests import ClientSession, RetryPolicy, create_session, make_request
+from galaxy.utils.pagination import fetch_pages_until
+from galaxy.utils.requests import ClientSession, ConnectionPolicy, RetryPolicy, create_session, make_request
 
 __all__ = ["OpsgenieClient"]
 
 
 class OpsgenieClient:
     PAGINATION_SIZE: int = 100
+    # Number of pages of a paginated list fetched at the same time
+    PAGES_MAX_CONCURRENCY: int = 5
 
     def __init__(self, config: Config, logger: logging.Logger):
         self.logger = logger
@@ -23,9 +26,10 @@ class OpsgenieClient:
 
         self.session: ClientSession | None = None
         self._retry_policy = RetryPolicy(logger=self.logger, wait_multiplier=2, wait_min=60, wait_max=120)
+        self._connection_policy = ConnectionPolicy.from_properties(config.integration.properties)
 
     async def __aenter__(self) -> "OpsgenieClient":
-        self.session = create_session(headers=self.headers)
+        self.session = create_session(headers=self.headers, connection_policy=self._connection_policy)
         return self
 
     async def __aexit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
@@ -39,14 +43,19 @@ class OpsgenieClient:
         return await make_request(self.session, method, url, **kwargs, retry_policy=self._retry_policy)
 
     async def _fetch_list_data(self, url: str, **kwargs: Any) -> list[dict[str, Any]]:
-        params = {**kwargs.pop("params", {}), "offset": 0, "limit": self.PAGINATION_SIZE}
-        response = await self._make_request("GET", url, params=params, **kwargs)
-        results = response["data"]
-        while "paging" in response and len(response["data"]) >= self.PAGINATION_SIZE:
-            params["offset"] += self.PAGINATION_SIZE
-            response = await self._make_request("GET", url, params=params, **kwargs)
-            results.extend(response["data"])
-        return results
+        params = kwargs.pop("params", {})
+
+        async def _fetch_page(page: int) -> dict[str, Any]:
+            page_params = {**params, "offset": page * self.PAGINATION_SIZE, "limit": self.PAGINATION_SIZE}
+            return await self._make_request("GET", url, params=page_params, **kwargs)
+
+        responses = await fetch_pages_until(
+            _fetch_page,
+            lambda response: "paging" not in response or len(response["data"]) < self.PAGINATION_SIZE,
+            first_page=0,
+            max_concurrency=self.PAGES_MAX_CONCURRENCY,
+        )
+        return [item for response in responses for item in response["data"]]
 
     async def get_teams(self) -> list[dict[str, Any]]:
         return await self._fetch_list_data(f"{self.url}/v2/teams")
@@ -1,14 +1,11 @@
+from datetime import UTC, datetime
 from types import TracebackType
 
 from galaxy.core.galaxy import Integration, register
 from galaxy.core.models import Config
 from galaxy.integrations.opsgenie.client import OpsgenieClient
-from galaxy.integrations.opsgenie.utils import (
-    flatten_team_timeline,
-    get_user_next_on_call_shift,
-    get_user_on_call_teams,
-    map_users_to_teams,
-)
+from galaxy.integrations.opsgenie.utils import OnCallIndex, flatten_team_timeline, map_users_to_teams
+from galaxy.utils.concurrency import get_api_max_concurrency, run_concurrently
 
 __all__ = ["Opsgenie"]
 
@@ -16,6 +13,8 @@ __all__ = ["Opsgenie"]
 class Opsgenie(Integration):
     _methods = []
 
+    DEFAULT_API_MAX_CONCURRENCY: int = 5
+
     def __init__(self, config: Config):
         super().__init__(config)
         self.client = OpsgenieClient(self.config, self.logger)
@@ -32,6 +31,12 @@ class Opsgenie(Integration):
     async def __aexit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
         await self.client.__aexit__(exc_type, exc, tb)
 
+    @property
+    def api_max_concurrency(self) -> int:
+        return get_api_max_concurrency(
+            self.config.integration.properties, self.DEFAULT_API_MAX_CONCURRENCY, self.logger
+        )
+
     @register(_methods, group=1)
     async def team(self) -> list[dict]:
         teams = {}
@@ -39,8 +44,11 @@ class Opsgenie(Integration):
         teams_metadata = await self.client.get_teams()
 
         #  Fetch extra team details (e.g. members information)
-        for team in teams_metadata:
-            teams[team["id"]] = await self.client.get_team(team["id"])
+        teams_details = await run_concurrently(
+            lambda team: self.client.get_team(team["id"]), teams_metadata, max_concurrency=self.api_max_concurrency
+        )
+        for team, team_details in zip(teams_metadata, teams_details):
+            teams[team["id"]] = team_details
 
             # Initialize other custom team information
             teams[team["id"]]["schedules"] = []
@@ -48,8 +56,13 @@ class Opsgenie(Integration):
 
         # Link on-call schedules to teams (teams may have multiple or none)
         schedules = await self.client.get_schedules()
-        for schedule in schedules:
-            schedule["timeline"] = await self.client.get_schedule_timeline(schedule["id"])
+        timelines = await run_concurrently(
+            lambda schedule: self.client.get_schedule_timeline(schedule["id"]),
+            schedules,
+            max_concurrency=self.api_max_concurrency,
+        )
+        for schedule, timeline in zip(schedules, timelines):
+            schedule["timeline"] = timeline
             if schedule["ownerTeam"]["id"] not in teams:
                 continue
             teams[schedule["ownerTeam"]["id"]]["schedules"].append(schedule)
@@ -75,10 +88,12 @@ class Opsgenie(Integration):
     async def user(self) -> list[dict]:
         self.users = await self.client.get_users()
         teams_per_user = map_users_to_teams(self.teams)
+        on_call_index = OnCallIndex(self.teams, self.logger)
+        now = datetime.now(UTC)
         for user in self.users:
             user["teams"] = teams_per_user.get(user["id"]) or []
-            user["teamsOnCall"] = get_user_on_call_teams(user)
-            user["nextOnCallShift"] = get_user_next_on_call_shift(user, self.logger)
+            user["teamsOnCall"] = on_call_index.get_user_on_call_teams(user, now)
+            user["nextOnCallShift"] = on_call_index.get_user_next_on_call_shift(user, now)
 
         users_mapped = await self.mapper.process(
             "user", self.users, context={"baseUrl": self.config.integration.properties["appBaseUrl"]}
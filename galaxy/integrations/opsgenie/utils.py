@@ -1,4 +1,6 @@
-from datetime import datetime, timezone
+import bisect
+from collections import defaultdict
+from datetime import UTC, datetime
 
 from dateutil.parser import isoparse
 
@@ -38,52 +40,49 @@ def flatten_team_timeline(schedules):
     return team_timeline
 
 
-def get_user_on_call_teams(user):
-    teams_on_call = []
-
-    now = datetime.now(timezone.utc)
-    for team in user["teams"]:
-        ongoing_periods = [
-            period for period in team["timeline"] if isoparse(period["startDate"]) <= now <= isoparse(period["endDate"])
-        ]
-        user_on_call = user["id"] in [
-            period["recipient"]["id"] for period in ongoing_periods if period["recipient"].get("id")
-        ]
-        if user_on_call:
-            teams_on_call.append(team["id"])
-
-    return teams_on_call
-
-
-def get_user_next_on_call_shift(user, logger):
-    # Initialize the variable to hold the next shift (start with None)
-    next_shift = {"startDate": None, "endDate": None, "teamId": None}
-
-    # Get the current time for comparison, making it offset-aware
-    now = datetime.now(timezone.utc)
-
-    # Iterate over all the teams the user is part of
-    for team in user["teams"]:
-        # Iterate over all periods in the team's timeline
-        for period in team["timeline"]:
-            # Parse the start and end dates of the period (usually offset-aware)
-            start_date = isoparse(period["startDate"])
-
-            # Check if the user's ID is in the list of recipients and the period is in the future
-            recipient_id = period["recipient"].get("id")
-            if recipient_id is not None:
-                if user["id"] == recipient_id and start_date > now:
-                    # If next_shift is not set or the start_date is earlier than the current next_shift, update next_shift
-                    if next_shift["startDate"] is None or start_date < isoparse(next_shift["startDate"]):
-                        next_shift = {
-                            "startDate": period["startDate"],
-                            "endDate": period["endDate"],
-                            "teamId": team["id"],
-                        }
-            else:
-                logger.debug(
-                    "Unable to interpret future on-call period; recipient not specified. Period details: %s", period
+class OnCallIndex:
+    """Index of the on-call periods of the teams timelines by recipient, with their dates parsed only once.
+
+    The periods of each recipient are sorted by start date, so that the ongoing periods and the next shift of a user
+    are found with a binary search instead of going through the timeline of each of their teams.
+    """
+
+    def __init__(self, teams, logger):
+        periods = defaultdict(list)
+        for team in teams:
+            for period in team["timeline"]:
+                recipient_id = period["recipient"].get("id")
+                if recipient_id is None:
+                    logger.debug(
+                        "Unable to interpret future on-call period; recipient not specified. Period details: %s", period
+                    )
+                    continue
+                periods[recipient_id].append(
+                    (isoparse(period["startDate"]), isoparse(period["endDate"]), team["id"], period)
                 )
 
-    # Return the next shift if found, otherwise return an empty dictionary
-    return next_shift
+        # The sort is stable: periods starting at the same time keep the order of the teams
+        self._periods = {
+            recipient_id: sorted(items, key=lambda item: item[0]) for recipient_id, items in periods.items()
+        }
+        self._start_dates = {recipient_id: [item[0] for item in items] for recipient_id, items in self._periods.items()}
+
+    def get_user_on_call_teams(self, user, now=None):
+        now = now or datetime.now(UTC)
+        periods = self._periods.get(user["id"], [])
+
+        # Timelines have no historical periods, so the periods that started already are few and mostly ongoing
+        started = bisect.bisect_right(self._start_dates.get(user["id"], []), now)
+        on_call_team_ids = {team_id for _, end_date, team_id, _ in periods[:started] if now <= end_date}
+        return [team["id"] for team in user["teams"] if team["id"] in on_call_team_ids]
+
+    def get_user_next_on_call_shift(self, user, now=None):
+        now = now or datetime.now(UTC)
+        team_ids = {team["id"] for team in user["teams"]}
+        periods = self._periods.get(user["id"], [])
+
+        for _, _, team_id, period in periods[bisect.bisect_right(self._start_dates.get(user["id"], []), now) :]:
+            if team_id in team_ids:
+                return {"startDate": period["startDate"], "endDate": period["endDate"], "teamId": team_id}
+
+        return {"startDate": None, "endDate": None, "teamId": None}
@@ -1,13 +1,18 @@
 from datetime import datetime, timedelta, timezone
 from typing import ClassVar
 
+import anyio
+from anyio import to_thread
 from pdpyras import APISession, PDClientError, PDHTTPError
 
+from galaxy.utils.concurrency import get_api_max_concurrency
+
 __all__ = ["PagerdutyClient"]
 
 
 class PagerdutyClient:
     DEFAULT_API_URL: ClassVar[str] = "https://api.eu.pagerduty.com"
+    DEFAULT_API_MAX_CONCURRENCY: ClassVar[int] = 10
 
     def __init__(self, config, logger):
         self.config = config
@@ -29,11 +34,25 @@ class PagerdutyClient:
         start_date = now - timedelta(days=int(config.integration.properties["daysOfHistory"]))
         self.start_date = start_date.isoformat()
 
+        # The session is blocking: its requests run in worker threads, up to `api_max_concurrency` at a time. The limiter
+        # is created on first use as it cannot be deep copied.
+        self._limiter: anyio.CapacityLimiter | None = None
+
+    @property
+    def api_max_concurrency(self) -> int:
+        return get_api_max_concurrency(
+            self.config.integration.properties, self.DEFAULT_API_MAX_CONCURRENCY, self.logger
+        )
+
+    async def _iter_all(self, path: str, params: dict | None = None) -> list[dict]:
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.api_max_concurrency)
+
+        return await to_thread.run_sync(lambda: list(self.session.iter_all(path, params)), limiter=self._limiter)
+
     async def get_teams(self) -> list[dict]:
         try:
-            teams_iter = self.session.iter_all("teams")
-
-            return list(teams_iter)
+            return await self._iter_all("teams")
         except PDHTTPError as e:
             if e.response.status_code == 404:
                 self.logger.error("No pagerduty teams found")
@@ -46,9 +65,7 @@ class PagerdutyClient:
 
     async def get_users(self) -> list[dict]:
         try:
-            users_iter = self.session.iter_all("users")
-
-            return list(users_iter)
+            return await self._iter_all("users")
         except PDHTTPError as e:
             if e.response.status_code == 404:
                 self.logger.error("No pagerduty users found")
@@ -61,9 +78,7 @@ class PagerdutyClient:
 
     async def get_services(self) -> list[dict]:
         try:
-            services_iter = self.session.iter_all("services")
-
-            return list(services_iter)
+            return await self._iter_all("services")
         except PDHTTPError as e:
             if e.response.status_code == 404:
                 self.logger.error("No pagerduty services found")
@@ -79,9 +94,7 @@ class PagerdutyClient:
             if params is None:
                 params = {"since": self.start_date}
 
-            on_calls_iter = self.session.iter_all("oncalls", params)
-
-            return list(on_calls_iter)
+            return await self._iter_all("oncalls", params)
         except PDHTTPError as e:
             if e.response.status_code == 404:
                 self.logger.error("No pagerduty onCalls found")
@@ -97,9 +110,7 @@ class PagerdutyClient:
             params = {"since": self.start_date}
 
         try:
-            incidents_iter = self.session.iter_all("incidents", params)
-
-            return list(incidents_iter)
+            return await self._iter_all("incidents", params)
         except PDHTTPError as e:
             if e.response.status_code == 404:
                 self.logger.error("No pagerduty incidents found")
@@ -113,9 +124,7 @@ class PagerdutyClient:
 
     async def get_schedules(self, params: dict = None) -> list[dict]:
         try:
-            schedules_iter = self.session.iter_all("schedules", params)
-
-            return list(schedules_iter)
+            return await self._iter_all("schedules", params)
         except PDHTTPError as e:
             if e.response.status_code == 404:
                 self.logger.error("No pagerduty incidents found")
@@ -128,9 +137,7 @@ class PagerdutyClient:
 
     async def get_escalation_policies(self, params: dict = None) -> list[dict]:
         try:
-            policies_iter = self.session.iter_all("escalation_policies", params)
-
-            return list(policies_iter)
+            return await self._iter_all("escalation_policies", params)
         except PDHTTPError as e:
             if e.response.status_code == 404:
                 self.logger.error("No pagerduty incidents found")
@@ -3,7 +3,8 @@ from datetime import datetime, timedelta, timezone
 from galaxy.core.galaxy import register, Integration
 from galaxy.core.models import Config
 from galaxy.integrations.pagerduty.client import PagerdutyClient
-from galaxy.integrations.pagerduty.utils import get_on_call_info, update_user_on_call_info
+from galaxy.integrations.pagerduty.utils import group_on_calls_by_user, update_user_on_call_info
+from galaxy.utils.concurrency import run_concurrently
 
 
 class Pagerduty(Integration):
@@ -17,11 +18,15 @@ class Pagerduty(Integration):
     async def teams(self) -> list[dict]:
         # self.on_calls = await self.client.get_on_calls()
         teams = await self.client.get_teams()
-        for team in teams:
+
+        async def _get_team_schedules(team: dict) -> None:
             team["schedules"] = await self.client.get_schedules(
                 params={"exclude[]": ["users", "teams", "escalation_policies"], "team_ids[]": [team.get("id")]}
             )
 
+        # The client runs up to its max concurrency of requests at a time
+        await run_concurrently(_get_team_schedules, teams)
+
         teams_mapped = await self.mapper.process("team", teams, context={})
         self.logger.info(f"Found {len(teams_mapped)} teams")
 
@@ -34,11 +39,23 @@ class Pagerduty(Integration):
         start_time = datetime.now(timezone.utc)
         end_time = start_time + timedelta(days=int(self.config.integration.properties["daysOfHistory"]))
 
+        # The on-calls of all the users are fetched at once, then looked up by user
+        current_oncalls = group_on_calls_by_user(await self.client.get_on_calls(params={"time_zone": "UTC"}))
+        next_oncalls = group_on_calls_by_user(
+            await self.client.get_on_calls(
+                params={
+                    "time_zone": "UTC",
+                    "since": start_time.isoformat(),
+                    "until": end_time.isoformat(),
+                    "earliest": "true",
+                }
+            )
+        )
+
         for user in users:
-            current_oncall, next_oncall = await get_on_call_info(
-                self.client, user, start_time.isoformat(), end_time.isoformat()
+            update_user_on_call_info(
+                user, current_oncalls.get(user.get("id"), []), next_oncalls.get(user.get("id"), [])
             )
-            update_user_on_call_info(user, current_oncall, next_oncall)
 
         mapped_users = await self.mapper.process("user", users, context={})
         self.logger.info(f"Found {len(mapped_users)} users")
@@ -0,0 +1,30 @@
+import copy
+
+import pytest
+
+from galaxy.core.models import Config
+from galaxy.integrations.pagerduty.main import Pagerduty
+
+
+@pytest.fixture
+def config():
+    return Config(
+        integration={
+            "type": "pagerduty",
+            "id": "pagerduty_id",
+            "executionType": "daemon",
+            "scheduledInterval": 1,
+            "defaultModelMappings": {},
+            "properties": {"apiKey": "key", "url": "https://api.pagerduty.com", "daysOfHistory": 30},
+        },
+        rely={"url": "http://testurl.com", "token": "test_token"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_pagerduty_integration_can_be_deep_copied(config, mocker):
+    # Daemon mode runs a deep copy of the integration on each schedule
+    integration = copy.deepcopy(Pagerduty(config))
+
+    mocker.patch.object(integration.client.session, "iter_all", return_value=iter([{"id": "T1"}]))
+    assert await integration.client.get_teams() == [{"id": "T1"}]
@@ -1,27 +1,26 @@
-from galaxy.integrations.pagerduty.client import PagerdutyClient
+from collections import defaultdict
+from datetime import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 
-async def get_on_call_info(
-    client: PagerdutyClient, user: dict, start_time: str, end_time: str
-) -> tuple[list[dict], list[dict]]:
-    """Fetch current and next on-call info for a user."""
-    # Get current on-call status
-    current_oncall = await client.get_on_calls(
-        params={"user_ids[]": user.get("id"), "time_zone": user.get("time_zone")}
-    )
+def group_on_calls_by_user(on_calls: list[dict]) -> dict[str, list[dict]]:
+    """Group on-calls by the ID of their user, keeping their order."""
+    on_calls_by_user = defaultdict(list)
+    for on_call in on_calls:
+        if user_id := (on_call.get("user") or {}).get("id"):
+            on_calls_by_user[user_id].append(on_call)
+    return on_calls_by_user
 
-    # Get next on-call status
-    next_oncall = await client.get_on_calls(
-        params={
-            "user_ids[]": user.get("id"),
-            "time_zone": user.get("time_zone"),
-            "since": start_time,
-            "until": end_time,
-            "earliest": "true",
-        }
-    )
 
-    return current_oncall, next_oncall
+def to_time_zone(value: str | None, time_zone: str | None) -> str | None:
+    """Convert an ISO 8601 date to the given time zone, as the API does with its `time_zone` parameter."""
+    if not value or not time_zone:
+        return value
+
+    try:
+        return datetime.fromisoformat(value).astimezone(ZoneInfo(time_zone)).isoformat()
+    except (ValueError, ZoneInfoNotFoundError):
+        return value
 
 
 def update_user_on_call_info(user: dict, current_oncall: list[dict], next_oncall: list[dict]):
@@ -30,6 +29,10 @@ def update_user_on_call_info(user: dict, current_oncall: list[dict], next_oncall
     next_oncall_start = next_oncall[0].get("start") if next_oncall and next_oncall[0] is not None else None
     next_oncall_end = next_oncall[0].get("end") if next_oncall and next_oncall[0] is not None else None
 
+    # On-calls are fetched for all the users at once, so their dates are converted to the time zone of each user
+    next_oncall_start = to_time_zone(next_oncall_start, user.get("time_zone"))
+    next_oncall_end = to_time_zone(next_oncall_end, user.get("time_zone"))
+
     # Update on-call status if the user is not currently on-call
     if not is_oncall and next_oncall_start is None and next_oncall_end is None:
         is_oncall = True
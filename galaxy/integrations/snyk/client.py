@@ -6,7 +6,7 @@ from typing import Any
 from datetime import datetime
 
 from galaxy.core.models import Config
-from galaxy.utils.requests import ClientSession, create_session, make_request
+from galaxy.utils.requests import ClientSession, ConnectionPolicy, create_session, make_request
 
 
 REGION_MAPPING = {
@@ -36,6 +36,7 @@ class SnykClient:
             self._session_kwargs = dict(base_url=REGION_MAPPING[region])
         except KeyError:
             raise ValueError(f"Invalid Snyk hosting region: {region}")
+        self._session_kwargs["connection_policy"] = ConnectionPolicy.from_properties(config.integration.properties)
 
     async def __aenter__(self) -> "SnykClient":
         self._session = create_session(timeout=60, headers=self._headers, **self._session_kwargs)
@@ -74,13 +75,12 @@ class SnykClient:
     async def get_targets(self, org_id: str) -> list[dict]:
         return await self._fetch_list_data(f"/rest/orgs/{org_id}/targets")
 
-    async def get_projects(self, org_id: str, target_id: str) -> list[dict]:
-        return await self._fetch_list_data(
-            f"/rest/orgs/{org_id}/projects", params={"target_id": [target_id], "meta.latest_issue_counts": "true"}
-        )
+    async def get_org_projects(self, org_id: str) -> list[dict]:
+        return await self._fetch_list_data(f"/rest/orgs/{org_id}/projects", params={"meta.latest_issue_counts": "true"})
 
-    async def get_issues(self, org_id: str, project_id: str, history_start_date: datetime | None = None) -> list[dict]:
-        params = {"scan_item.type": "project", "scan_item.id": project_id}
+    async def get_org_issues(self, org_id: str, history_start_date: datetime | None = None) -> list[dict]:
+        """List the issues of all the scan items (e.g. projects) of an organization at once."""
+        params = {}
         if history_start_date is not None:
             params["created_after"] = history_start_date.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
         return await self._fetch_list_data(f"/rest/orgs/{org_id}/issues", params=params)
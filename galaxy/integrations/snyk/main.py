@@ -1,3 +1,4 @@
+from collections import defaultdict
 from datetime import datetime, timedelta
 from types import TracebackType
 from typing import Any
@@ -5,11 +6,14 @@ from typing import Any
 from galaxy.core.galaxy import Integration, register
 from galaxy.core.models import Config
 from galaxy.integrations.snyk.client import SnykClient
+from galaxy.utils.concurrency import get_api_max_concurrency, run_concurrently
 
 
 class Snyk(Integration):
     _methods = []
 
+    DEFAULT_API_MAX_CONCURRENCY: int = 10
+
     def __init__(self, config: Config):
         super().__init__(config)
         self.client = SnykClient(self.config, self.logger)
@@ -24,6 +28,12 @@ class Snyk(Integration):
     async def __aexit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
         await self.client.__aexit__(exc_type, exc, tb)
 
+    @property
+    def api_max_concurrency(self) -> int:
+        return get_api_max_concurrency(
+            self.config.integration.properties, self.DEFAULT_API_MAX_CONCURRENCY, self.logger
+        )
+
     @register(_methods, group=1)
     async def organizations(self) -> tuple[Any]:
         raw_organizations = await self.client.get_orgs()
@@ -38,15 +48,24 @@ class Snyk(Integration):
     async def targets(self) -> tuple[Any]:
         all_targets = []
 
-        for org_id, org_slug in self._organizations.items():
-            raw_targets = await self.client.get_targets(org_id)
+        # The projects of each organization are listed once, then grouped by target
+        async def _get_targets_and_projects(org_id: str) -> tuple[list[dict], list[dict]]:
+            return await self.client.get_targets(org_id), await self.client.get_org_projects(org_id)
+
+        orgs_targets_and_projects = await run_concurrently(
+            _get_targets_and_projects, list(self._organizations), max_concurrency=self.api_max_concurrency
+        )
+        for (org_id, org_slug), (raw_targets, raw_org_projects) in zip(
+            self._organizations.items(), orgs_targets_and_projects
+        ):
+            targets_projects = defaultdict(list)
+            for item in raw_org_projects:
+                target_id = item["relationships"]["target"]["data"]["id"]
+                targets_projects[target_id].append(item | {"__organization_slug": org_slug})
 
             targets = {item["id"]: item for item in raw_targets}
             for target_id in targets:
-                raw_projects = [
-                    item | {"__organization_slug": org_slug}
-                    for item in await self.client.get_projects(org_id, target_id)
-                ]
+                raw_projects = targets_projects.get(target_id, [])
 
                 targets[target_id]["__projects"] = raw_projects
                 self._all_projects.extend(raw_projects)
@@ -67,28 +86,39 @@ class Snyk(Integration):
 
     @register(_methods, group=3)
     async def issues(self) -> list[Any]:
-        organization_target_project_triples = [
-            (
-                item["relationships"]["organization"]["data"]["id"],
-                item["relationships"]["target"]["data"]["id"],
-                item["id"],
-            )
-            for item in self._all_projects
-        ]
-
         history_start_date = datetime.now() - timedelta(days=int(self.config.integration.properties["daysOfHistory"]))
 
+        # Issues are listed once per organization, then matched to the target of the project they were found in. Issues
+        # of other scan items (e.g. projects that were not listed) are skipped.
+        projects_targets = {item["id"]: item["relationships"]["target"]["data"]["id"] for item in self._all_projects}
+        org_ids = list(
+            dict.fromkeys(item["relationships"]["organization"]["data"]["id"] for item in self._all_projects)
+        )
+        orgs_issues = await run_concurrently(
+            lambda org_id: self.client.get_org_issues(org_id, history_start_date),
+            org_ids,
+            max_concurrency=self.api_max_concurrency,
+        )
+
+        # Issues are mapped in batches of all the issues sharing the same context, i.e. of the same target
+        targets_issues = defaultdict(list)
+        for org_id, raw_issues in zip(org_ids, orgs_issues):
+            for raw_issue in raw_issues:
+                scan_item = raw_issue.get("relationships", {}).get("scan_item", {}).get("data") or {}
+                if scan_item.get("type") == "project" and scan_item.get("id") in projects_targets:
+                    targets_issues[(org_id, projects_targets[scan_item["id"]])].append(raw_issue)
+
         mapped_issues = []
-        for org_id, target_id, project_id in organization_target_project_triples:
-            raw_issues = await self.client.get_issues(org_id, project_id, history_start_date)
-            project_issues = await self.mapper.process(
+        for (org_id, target_id), raw_issues in targets_issues.items():
+            target_issues = await self.mapper.process(
                 "issue", raw_issues, context={"target_id": target_id, "organization_slug": self._organizations[org_id]}
             )
-            mapped_issues.extend(project_issues)
+            mapped_issues.extend(target_issues)
 
         self.logger.debug(
             "Found %d issues from the last %s days",
-            (len(mapped_issues), self.config.integration.properties["daysOfHistory"]),
+            len(mapped_issues),
+            self.config.integration.properties["daysOfHistory"],
         )
 
         return mapped_issues
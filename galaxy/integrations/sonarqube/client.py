@@ -1,13 +1,30 @@
 __all__ = ["SonarqubeClient"]
 
 import math
+from datetime import UTC, datetime, timedelta
 from types import TracebackType
+from typing import ClassVar
+
+import anyio
 
 from galaxy.core.models import Config
-from galaxy.utils.requests import ClientSession, create_session, make_request
+from galaxy.utils.concurrency import run_concurrently
+from galaxy.utils.pagination import fetch_pages
+from galaxy.utils.requests import ClientSession, ConnectionPolicy, create_session, make_request
 
 
 class SonarqubeClient:
+    # Number of pages of a paginated list fetched at the same time
+    PAGES_MAX_CONCURRENCY: int = 5
+    # Maximum number of results the issues search can page through, whatever the page size
+    ISSUES_MAX_RESULTS: int = 10_000
+    # Filters used in turn to split an issues search exceeding the result window, before splitting it by creation date
+    ISSUES_SPLIT_FILTERS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "types": ("BUG", "VULNERABILITY", "CODE_SMELL"),
+        "severities": ("INFO", "MINOR", "MAJOR", "CRITICAL", "BLOCKER"),
+    }
+    ISSUES_DATETIME_FORMAT: str = "%Y-%m-%dT%H:%M:%S%z"
+
     def __init__(self, config: Config, logger):
         self.config = config
         self.logger = logger
@@ -17,7 +34,10 @@ class SonarqubeClient:
             "Authorization": f"Bearer {config.integration.properties['apiToken']}",
             "Content-Type": "application/json",
         }
-        self._session_kwargs = dict(base_url=config.integration.properties["serverUrl"])
+        self._session_kwargs = dict(
+            base_url=config.integration.properties["serverUrl"],
+            connection_policy=ConnectionPolicy.from_properties(config.integration.properties),
+        )
 
     async def __aenter__(self) -> "SonarqubeClient":
         self._session = create_session(headers=self._headers, **self._session_kwargs)
@@ -43,8 +63,11 @@ class SonarqubeClient:
         components = response["components"]
 
         page_count = max(math.ceil(response["paging"]["total"] / page_size), 1)
-        for page in range(2, page_count + 1):
-            response = await make_request(self.session, "GET", f"/api/projects/search?ps={page_size}&p={page}")
+        for response in await fetch_pages(
+            lambda page: make_request(self.session, "GET", f"/api/projects/search?ps={page_size}&p={page}"),
+            range(2, page_count + 1),
+            max_concurrency=self.PAGES_MAX_CONCURRENCY,
+        ):
             components.extend(response["components"])
 
         return components
@@ -60,14 +83,82 @@ class SonarqubeClient:
         return response["branches"]
 
     async def list_issues(self, components: str, page_size: int = 500) -> list[dict]:
-        response = await make_request(self.session, "GET", f"/api/issues/search?components={components}&ps={page_size}")
-        issues = response["issues"]
-
-        page_count = max(math.ceil(response["paging"]["total"] / page_size), 1)
-        for page in range(2, page_count + 1):
-            response = await make_request(
-                self.session, "GET", f"/api/issues/search?components={components}&ps={page_size}&p={page}"
-            )
-            issues.extend(response["issues"])
-
-        return issues
+        """List the issues of the given components.
+
+        A search cannot page through more than `ISSUES_MAX_RESULTS` issues, so the ones exceeding it are split into
+        slices, by type and severity, then by halving their creation date range, until each slice fits in the window.
+        The slices are crawled concurrently, with up to `PAGES_MAX_CONCURRENCY` requests at a time.
+        """
+        semaphore = anyio.Semaphore(self.PAGES_MAX_CONCURRENCY)
+
+        async def _search(filters: dict[str, str], page: int) -> dict:
+            params = {"components": components, "s": "CREATION_DATE", "asc": "true", "ps": page_size, "p": page}
+            async with semaphore:
+                return await make_request(self.session, "GET", "/api/issues/search", params=params | filters)
+
+        async def _list_slice(filters: dict[str, str]) -> list[dict]:
+            response = await _search(filters, 1)
+            issues = response["issues"]
+            total = response["paging"]["total"]
+
+            if total > self.ISSUES_MAX_RESULTS:
+                slices = self._split_issues_filters(filters, issues)
+                if slices:
+                    # Requests are limited by the semaphore, whatever the number of slices crawled at once
+                    slices_issues = await run_concurrently(_list_slice, slices)
+                    return [issue for slice_issues in slices_issues for issue in slice_issues]
+
+                self.logger.warning(
+                    "Cannot split the search of %d issues of %s (%s): only the first %d are listed",
+                    total,
+                    components,
+                    filters,
+                    self.ISSUES_MAX_RESULTS,
+                )
+                total = self.ISSUES_MAX_RESULTS
+
+            page_count = max(math.ceil(total / page_size), 1)
+            for response in await fetch_pages(
+                lambda page: _search(filters, page),
+                range(2, page_count + 1),
+                max_concurrency=self.PAGES_MAX_CONCURRENCY,
+            ):
+                issues.extend(response["issues"])
+
+            return issues
+
+        return await _list_slice({})
+
+    def _split_issues_filters(self, filters: dict[str, str], first_issues: list[dict]) -> list[dict[str, str]]:
+        """Split the filters of an issues search into filters of disjoint slices covering the same issues.
+
+        `first_issues` are the oldest issues of the search, used to bound its creation date range. An empty list is
+        returned when the search cannot be split anymore.
+        """
+        for name, values in self.ISSUES_SPLIT_FILTERS.items():
+            if name not in filters:
+                return [filters | {name: value} for value in values]
+
+        if "createdAfter" in filters:
+            created_after = datetime.strptime(filters["createdAfter"], self.ISSUES_DATETIME_FORMAT)
+            created_before = datetime.strptime(filters["createdBefore"], self.ISSUES_DATETIME_FORMAT)
+        elif first_issues:
+            # Dates are inclusive for `createdAfter` and exclusive for `createdBefore`, to the second
+            created_after = datetime.strptime(first_issues[0]["creationDate"], self.ISSUES_DATETIME_FORMAT)
+            created_before = datetime.now(UTC).replace(microsecond=0) + timedelta(seconds=1)
+        else:
+            return []
+
+        half_seconds = int((created_before - created_after).total_seconds()) // 2
+        if half_seconds < 1:
+            return []
+
+        created_middle = created_after + timedelta(seconds=half_seconds)
+        return [
+            filters
+            | {
+                "createdAfter": start.strftime(self.ISSUES_DATETIME_FORMAT),
+                "createdBefore": end.strftime(self.ISSUES_DATETIME_FORMAT),
+            }
+            for start, end in ((created_after, created_middle), (created_middle, created_before))
+        ]
@@ -1,9 +1,12 @@
+from collections.abc import AsyncGenerator
 from types import TracebackType
 from typing import Any
 
 from galaxy.core.galaxy import Integration, register
 from galaxy.core.models import Config
 from galaxy.integrations.sonarqube.client import SonarqubeClient
+from galaxy.utils.concurrency import get_api_max_concurrency, run_concurrently
+from galaxy.utils.itertools import chunks
 
 METRICS = ["bugs", "code_smells", "vulnerabilities", "security_hotspots", "duplicated_files", "coverage"]
 
@@ -11,6 +14,10 @@ METRICS = ["bugs", "code_smells", "vulnerabilities", "security_hotspots", "dupli
 class Sonarqube(Integration):
     _methods = []
 
+    DEFAULT_API_MAX_CONCURRENCY: int = 10
+    # Number of projects crawled before yielding their issues
+    STREAMING_PROJECTS_BATCH_SIZE: int = 20
+
     def __init__(self, config: Config):
         super().__init__(config)
         self.client = SonarqubeClient(self.config, self.logger)
@@ -24,27 +31,32 @@ class Sonarqube(Integration):
     async def __aexit__(self, exc_type: type, exc: Exception, tb: TracebackType) -> None:
         await self.client.__aexit__(exc_type, exc, tb)
 
+    @property
+    def api_max_concurrency(self) -> int:
+        return get_api_max_concurrency(
+            self.config.integration.properties, self.DEFAULT_API_MAX_CONCURRENCY, self.logger
+        )
+
     @register(_methods, group=1)
     async def projects(self) -> tuple[Any]:
         project_list = await self.client.list_all_projects()
 
-        project_data = []
-        for project in project_list:
+        async def _get_project_data(project: dict) -> dict:
             project_dict = {"project": project}
 
             project_branches = await self.client.list_branches(project["key"])
-            main_branch, *_ = [b for b in project_branches if b["isMain"]]
-            project_dict["branch"] = main_branch
+            project_dict["branch"] = next((b for b in project_branches if b["isMain"]), None)
+
+            # All the metrics are requested at once, and the ones without a measure are left empty
+            measures = await self.client.list_measures(project["key"], ",".join(METRICS))
+            project_dict["metrics"] = dict.fromkeys(METRICS) | {
+                measure["metric"]: measure.get("value") for measure in measures
+            }
 
-            # TODO: use comma-separated list instead of iterating
-            project_dict["metrics"] = {}
-            for metric in METRICS:
-                measure, *_ = await self.client.list_measures(project["key"], metric)
-                name, value = measure["metric"], measure["value"]
-                project_dict["metrics"][name] = value
+            return project_dict
 
-            project_data.append(project_dict)
-            self._project_keys.append(project["key"])
+        project_data = await run_concurrently(_get_project_data, project_list, max_concurrency=self.api_max_concurrency)
+        self._project_keys.extend(project["key"] for project in project_list)
 
         mapped_projects = await self.mapper.process("project", project_data)
         self.logger.debug("Found %d projects", len(mapped_projects))
@@ -52,13 +64,18 @@ class Sonarqube(Integration):
         return mapped_projects
 
     @register(_methods, group=2)
-    async def issues(self) -> tuple[Any]:
-        issues = []
-        for project_key in self._project_keys:
-            project_issues = await self.client.list_issues(project_key)
-            issues.extend(project_issues)
-
-        mapped_issues = await self.mapper.process("issue", issues)
-        self.logger.debug("Found %d issues", len(mapped_issues))
-
-        return mapped_issues
+    async def issues(self) -> AsyncGenerator[list[dict], None]:
+        # Issues are yielded per batch of projects so they can be pushed while the remaining projects are crawled
+        issues_count = 0
+        for project_keys in chunks(self._project_keys, self.STREAMING_PROJECTS_BATCH_SIZE):
+            issues = []
+            for project_issues in await run_concurrently(
+                self.client.list_issues, project_keys, max_concurrency=self.api_max_concurrency
+            ):
+                issues.extend(project_issues)
+
+            mapped_issues = await self.mapper.process("issue", issues)
+            issues_count += len(mapped_issues)
+            yield mapped_issues
+
+        self.logger.debug("Found %d issues", issues_count)
@@ -1,17 +1,29 @@
 import asyncio
 import functools
-from collections.abc import Awaitable, Callable
-from typing import ParamSpec, TypeVar
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from typing import Any, ParamSpec, TypeVar
 
 import anyio
 import uvloop
-from anyio import to_thread
+from anyio import to_process, to_thread
 from anyio.abc import Semaphore, TaskGroup
 
-__all__ = ["loop_setup", "set_thread_pool_limit", "run", "run_in_thread", "task_group_run_with_semaphore"]
+__all__ = [
+    "loop_setup",
+    "set_thread_pool_limit",
+    "set_process_pool_limit",
+    "run",
+    "run_in_thread",
+    "run_in_process",
+    "task_group_run_with_semaphore",
+    "run_concurrently",
+    "get_api_max_concurrency",
+]
 
 P = ParamSpec("P")
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 def loop_setup() -> None:
@@ -24,6 +36,11 @@ def set_thread_pool_limit(limit: int) -> None:
     to_thread.current_default_thread_limiter().total_tokens = limit
 
 
+def set_process_pool_limit(limit: int) -> None:
+    """Set the maximum number of worker processes."""
+    to_process.current_default_process_limiter().total_tokens = limit
+
+
 def run(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
     """Run the given coroutine function in an asynchronous event loop."""
     if kwargs:
@@ -38,6 +55,14 @@ async def run_in_thread(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs)
     return await to_thread.run_sync(func, *args)
 
 
+async def run_in_process(func: Callable[..., T], *args: Any) -> T:
+    """Call the given function with the given arguments in a worker process.
+
+    The function and its arguments must be picklable, and worker processes are reused between calls.
+    """
+    return await to_process.run_sync(func, *args)
+
+
 async def task_group_run_with_semaphore(
     task_group: TaskGroup, semaphore: Semaphore, func: Callable[P, Awaitable[T]], *args: P.args, **kwargs: P.kwargs
 ) -> None:
@@ -50,3 +75,43 @@ async def task_group_run_with_semaphore(
             semaphore.release()
 
     task_group.start_soon(wrapper, *args, **kwargs)
+
+
+async def run_concurrently(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], *, max_concurrency: int | None = None
+) -> list[R]:
+    """Call `func` for each item, up to `max_concurrency` calls at a time, and return the results in the items order.
+
+    Without `max_concurrency` all the calls run at once, e.g. when they are already limited by the client they use. If
+    a call fails, its error is raised instead of the task group one.
+    """
+    items = list(items)
+    if max_concurrency is None:
+        max_concurrency = max(len(items), 1)
+    elif max_concurrency < 1:
+        raise ValueError(f"Invalid max_concurrency: {max_concurrency}")
+
+    results: list[Any] = [None] * len(items)
+    semaphore = anyio.Semaphore(max_concurrency)
+
+    async def _run(index: int, item: T) -> None:
+        results[index] = await func(item)
+
+    try:
+        async with anyio.create_task_group() as tg:
+            for index, item in enumerate(items):
+                await task_group_run_with_semaphore(tg, semaphore, _run, index, item)
+    except ExceptionGroup as excgroup:
+        raise excgroup.exceptions[0] from excgroup
+
+    return results
+
+
+def get_api_max_concurrency(properties: Mapping[str, Any], default: int, logger: logging.Logger) -> int:
+    """Read the `apiMaxConcurrency` integration property, falling back to 1 (no concurrency) when it is invalid."""
+    value = int(properties.get("apiMaxConcurrency", default))
+    if value < 1:
+        logger.warning("Invalid apiMaxConcurrency: %d. Disabling concurrency", value)
+        return 1
+
+    return value
@@ -1,4 +1,4 @@
-from collections.abc import Collection, Generator
+from collections.abc import Callable, Collection, Generator, Iterable
 from typing import TypeVar
 
 T = TypeVar("T")
@@ -8,3 +8,22 @@ def chunks(lst: Collection[T], n: int) -> Generator[list[T], None, None]:
     """Yield successive n-sized chunks from lst."""
     for i in range(0, len(lst), n):
         yield lst[i : i + n]
+
+
+def chunks_by_size(
+    items: Iterable[T], n: int, max_size: int, size: Callable[[T], int]
+) -> Generator[list[T], None, None]:
+    """Yield successive chunks from items with at most n items and at most max_size total size.
+
+    Items bigger than max_size are yielded in a chunk of their own.
+    """
+    chunk, chunk_size = [], 0
+    for item in items:
+        item_size = size(item)
+        if chunk and (len(chunk) >= n or chunk_size + item_size > max_size):
+            yield chunk
+            chunk, chunk_size = [], 0
+        chunk.append(item)
+        chunk_size += item_size
+    if chunk:
+        yield chunk
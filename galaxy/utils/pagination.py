@@ -0,0 +1,47 @@
+from collections.abc import Awaitable, Callable, Iterable
+from itertools import count
+from typing import TypeVar
+
+from galaxy.utils.concurrency import run_concurrently
+
+__all__ = ["fetch_pages", "fetch_pages_until"]
+
+T = TypeVar("T")
+
+
+async def fetch_pages(
+    fetch_page: Callable[[int], Awaitable[T]], pages: Iterable[int], *, max_concurrency: int
+) -> list[T]:
+    """Fetch the given pages, up to `max_concurrency` at a time, and return them in the same order.
+
+    This is meant for the pages left once the total number of items or the last page is known, e.g. from the first
+    page of the results.
+    """
+    return await run_concurrently(fetch_page, pages, max_concurrency=max_concurrency)
+
+
+async def fetch_pages_until(
+    fetch_page: Callable[[int], Awaitable[T]],
+    is_last_page: Callable[[T], bool],
+    *,
+    first_page: int = 1,
+    max_concurrency: int,
+) -> list[T]:
+    """Fetch the pages from `first_page` up to the last one, when the number of pages is not known in advance.
+
+    The first page is fetched on its own, then the next ones in windows of `max_concurrency` pages. Up to
+    `max_concurrency - 1` pages after the last one may be requested, those are discarded.
+    """
+    page = await fetch_page(first_page)
+    results = [page]
+    if is_last_page(page):
+        return results
+
+    for window_start in count(first_page + 1, max_concurrency):
+        window = range(window_start, window_start + max_concurrency)
+        for page in await fetch_pages(fetch_page, window, max_concurrency=max_concurrency):
+            results.append(page)
+            if is_last_page(page):
+                return results
+
+    return results
@@ -1,22 +1,27 @@
 import logging
+import time
 import traceback
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from functools import partial
 from typing import Any, ClassVar, TypeAlias
 
-from aiohttp import ClientResponseError, ClientTimeout, ContentTypeError
+import anyio
+from aiohttp import ClientResponseError, ClientTimeout, ContentTypeError, TCPConnector, TraceConfig
 from aiohttp import ClientSession as AiohttpClientSession
 from aiohttp.client_exceptions import ClientError as AiohttpClientError
 from attr import define
 from tenacity import (
     AsyncRetrying,
+    RetryCallState,
     before_sleep_log,
     retry_if_exception_type,
     stop_after_attempt,
     wait_random_exponential,
 )
+from yarl import URL
 
 from .serializers import json_serialize
 
@@ -88,8 +93,8 @@ class RetryPolicy:
     exceptions_to_retry: tuple[type[Exception], ...] = (ServerError, RateLimitError)
 
     wait_multiplier: int = 1
-    wait_max: int = 10
-    wait_min: int = 60
+    wait_min: int = 1
+    wait_max: int = 60
 
     reraise: bool = True
     logger: logging.Logger | None = None
@@ -97,32 +102,244 @@ class RetryPolicy:
     def retry_attempts(self) -> AsyncRetrying:
         return AsyncRetrying(
             stop=stop_after_attempt(self.max_attempts),
-            wait=wait_random_exponential(min=self.wait_min, max=self.wait_max, multiplier=self.wait_multiplier),
+            wait=self._wait,
             before_sleep=before_sleep_log(self.logger, logging.WARNING) if self.logger else None,
             reraise=self.reraise,
             retry=retry_if_exception_type(self.exceptions_to_retry),
         )
 
+    def _wait(self, retry_state: RetryCallState) -> float:
+        # The rate limiter of the session already waits until the rate limit resets when the server told us when
+        error = retry_state.outcome.exception() if retry_state.outcome is not None else None
+        if isinstance(error, RateLimitError) and RateLimiter.has_reset(error.headers or {}):
+            return 0
+        return wait_random_exponential(min=self.wait_min, max=self.wait_max, multiplier=self.wait_multiplier)(
+            retry_state
+        )
+
+
+class RateLimiter:
+    """Rate limiter of the requests to a host, following the rate limit headers of its responses.
+
+    Supports `Retry-After`, `X-RateLimit-*` (e.g. GitHub) and `RateLimit-*` (e.g. GitLab) headers. Requests wait until
+    the rate limit resets once it is exhausted, and are spread evenly until the reset once it is running low.
+    """
+
+    # Requests are spread until the reset when less than this ratio of the limit remains
+    SLOW_DOWN_RATIO: float = 0.1
+
+    def __init__(self) -> None:
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset_at: float | None = None
+        self.blocked_until: float = 0
+
+        self._next_request_at: float = 0
+
+    @staticmethod
+    def _header(headers: Mapping[str, str], name: str) -> str | None:
+        return headers.get(f"X-RateLimit-{name}") or headers.get(f"RateLimit-{name}")
+
+    @classmethod
+    def has_reset(cls, headers: Mapping[str, str]) -> bool:
+        return bool(headers.get("Retry-After") or cls._header(headers, "Reset"))
+
+    def delay(self) -> float:
+        """Reserve the next request and return the seconds to wait before sending it."""
+        now = time.monotonic()
+        start = max(now, self.blocked_until)
+
+        if self.remaining is not None and self.reset_at is not None and self.reset_at > now:
+            if self.remaining <= 0:
+                start = max(start, self.reset_at)
+            else:
+                if self.limit and self.remaining < self.limit * self.SLOW_DOWN_RATIO:
+                    start = max(start, self._next_request_at)
+                    self._next_request_at = start + max(self.reset_at - start, 0) / self.remaining
+                # Count the request right away so that concurrent requests do not all see the same remaining budget
+                self.remaining -= 1
+
+        return start - now
+
+    async def acquire(self) -> None:
+        if (delay := self.delay()) > 0:
+            await anyio.sleep(delay)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Update the rate limit state from the headers of a response."""
+        now, now_epoch = time.monotonic(), time.time()
+
+        if retry_after := headers.get("Retry-After"):
+            try:
+                self.blocked_until = max(self.blocked_until, now + float(retry_after))
+            except ValueError:
+                try:
+                    self.blocked_until = max(
+                        self.blocked_until, now + parsedate_to_datetime(retry_after).timestamp() - now_epoch
+                    )
+                except (TypeError, ValueError):
+                    pass
+
+        try:
+            if (limit := self._header(headers, "Limit")) is not None:
+                self.limit = int(limit)
+            if (remaining := self._header(headers, "Remaining")) is not None:
+                self.remaining = int(remaining)
+            if (reset := self._header(headers, "Reset")) is not None:
+                reset = float(reset)
+                # The reset is either an epoch timestamp (GitHub, GitLab) or a number of seconds (IETF draft)
+                self.reset_at = now + (reset - now_epoch if reset > 1_000_000_000 else reset)
+        except ValueError:
+            pass
+
+
+class RateLimiters:
+    """Rate limiters by host and rate limit resource, shared by all the sessions of the process.
+
+    Some APIs have different rate limits for different resources of the same host (e.g. GitHub REST and GraphQL APIs).
+    The resource of a request is learned from the `X-RateLimit-Resource` header of previous responses to the same host
+    and first path segment.
+    """
+
+    def __init__(self) -> None:
+        self._limiters: dict[tuple[str, str], RateLimiter] = {}
+        self._resources: dict[tuple[str, str], str] = {}
+
+    def get(self, url: URL) -> RateLimiter:
+        host = url.host or ""
+        resource = self._resources.get((host, url.parts[1] if len(url.parts) > 1 else ""), "")
+        if (host, resource) not in self._limiters:
+            self._limiters[(host, resource)] = RateLimiter()
+        return self._limiters[(host, resource)]
+
+    def update(self, url: URL, headers: Mapping[str, str]) -> None:
+        if resource := headers.get("X-RateLimit-Resource"):
+            self._resources[(url.host or "", url.parts[1] if len(url.parts) > 1 else "")] = resource
+        self.get(url).update(headers)
 
-def create_session(*, timeout: int = 30, headers: dict[str, str] | None = None, **kwargs: Any) -> ClientSession:
+
+rate_limiters = RateLimiters()
+
+
+@define(kw_only=True)
+class ConnectionPolicy:
+    max_connections: int = 100
+    max_connections_per_host: int = 20
+    # Maximum number of requests in flight for each host (`None` for no limit other than the connections)
+    max_requests_per_host: int | None = None
+
+    keepalive_timeout: float = 30
+    dns_cache_ttl: int = 300
+
+    # Wait for the rate limits reported by the hosts (see `RateLimiter`)
+    follow_rate_limits: bool = True
+
+    @classmethod
+    def from_properties(cls, properties: dict[str, Any]) -> "ConnectionPolicy":
+        """Create a connection policy from the (optional) HTTP properties of an integration config."""
+        fields = {
+            "max_connections": ("httpMaxConnections", int),
+            "max_connections_per_host": ("httpMaxConnectionsPerHost", int),
+            "max_requests_per_host": ("httpMaxRequestsPerHost", int),
+            "keepalive_timeout": ("httpKeepaliveTimeout", float),
+            "dns_cache_ttl": ("httpDnsCacheTtl", int),
+        }
+        # Properties rendered from unset environment variables are empty, so they are ignored like missing ones
+        return cls(
+            **{
+                field: parse(properties[key])
+                for field, (key, parse) in fields.items()
+                if properties.get(key) not in (None, "")
+            }
+        )
+
+    def create_connector(self) -> TCPConnector:
+        return TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+
+    def create_trace_configs(self) -> list[TraceConfig]:
+        trace_configs = []
+        if self.max_requests_per_host:
+            trace_configs.append(_host_requests_limiter_trace_config(self.max_requests_per_host))
+        if self.follow_rate_limits:
+            trace_configs.append(_rate_limiter_trace_config(rate_limiters))
+        return trace_configs
+
+
+def _host_requests_limiter_trace_config(max_requests_per_host: int) -> TraceConfig:
+    semaphores: dict[str, anyio.Semaphore] = {}
+
+    async def on_request_start(session: ClientSession, context: Any, params: Any) -> None:
+        if params.url.host not in semaphores:
+            semaphores[params.url.host] = anyio.Semaphore(max_requests_per_host)
+        await semaphores[params.url.host].acquire()
+        context.host_semaphore = semaphores[params.url.host]
+
+    async def on_request_done(session: ClientSession, context: Any, params: Any) -> None:
+        if (semaphore := getattr(context, "host_semaphore", None)) is not None:
+            context.host_semaphore = None
+            semaphore.release()
+
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_done)
+    trace_config.on_request_exception.append(on_request_done)
+    return trace_config
+
+
+def _rate_limiter_trace_config(limiters: RateLimiters) -> TraceConfig:
+    async def on_request_start(session: ClientSession, context: Any, params: Any) -> None:
+        await limiters.get(params.url).acquire()
+
+    async def on_request_end(session: ClientSession, context: Any, params: Any) -> None:
+        limiters.update(params.url, params.response.headers)
+
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+def create_session(
+    *,
+    timeout: int = 30,
+    headers: dict[str, str] | None = None,
+    connection_policy: ConnectionPolicy | None = None,
+    **kwargs: Any,
+) -> ClientSession:
     base_url = kwargs.pop("base_url", None)
     if base_url is not None and not base_url.endswith("/"):
         base_url += "/"
+    if connection_policy is None:
+        connection_policy = ConnectionPolicy()
     return ClientSession(
         base_url=base_url,
         timeout=ClientTimeout(total=timeout),
         # aiohttp expects json_serialize to return string
         json_serialize=kwargs.pop("json_serialize", lambda obj: json_serialize(obj).decode()),
         headers=headers,
+        connector=kwargs.pop("connector", None) or connection_policy.create_connector(),
+        trace_configs=kwargs.pop("trace_configs", None) or connection_policy.create_trace_configs(),
         **kwargs,
     )
 
 
 @asynccontextmanager
 async def with_session(
-    *, timeout: int = 30, headers: dict[str, str] | None = None, **kwargs: Any
+    *,
+    timeout: int = 30,
+    headers: dict[str, str] | None = None,
+    connection_policy: ConnectionPolicy | None = None,
+    **kwargs: Any,
 ) -> Generator[ClientSession, None, None]:
-    async with create_session(timeout=timeout, headers=headers, **kwargs) as session:
+    async with create_session(
+        timeout=timeout, headers=headers, connection_policy=connection_policy, **kwargs
+    ) as session:
         yield session
 
 
@@ -140,7 +357,7 @@ async def make_request(
     response_content: Any | None = None
     try:
         if not retry:
-            response_content = await _make_request(session, method, url, **kwargs)
+            return await _make_request(session, method, url, **kwargs)
 
         if retry_policy is None:
             retry_policy = RetryPolicy(logger=logger)
@@ -0,0 +1,36 @@
+import anyio
+import pytest
+
+from galaxy.utils.concurrency import run_concurrently
+
+
+async def test_run_concurrently_keeps_order_and_limits_concurrency():
+    in_flight = max_in_flight = 0
+
+    async def func(item: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await anyio.sleep(0.01 * (5 - item))
+        in_flight -= 1
+        return item * 2
+
+    assert await run_concurrently(func, range(5), max_concurrency=2) == [0, 2, 4, 6, 8]
+    assert max_in_flight == 2
+
+    max_in_flight = 0
+    assert await run_concurrently(func, range(5)) == [0, 2, 4, 6, 8]
+    assert max_in_flight == 5
+
+
+async def test_run_concurrently_raises_the_error_of_a_call():
+    async def func(item: int) -> int:
+        if item == 2:
+            raise ValueError("item 2")
+        return item
+
+    with pytest.raises(ValueError, match="item 2"):
+        await run_concurrently(func, range(4), max_concurrency=2)
+
+    with pytest.raises(ValueError, match="Invalid max_concurrency"):
+        await run_concurrently(func, range(4), max_concurrency=0)
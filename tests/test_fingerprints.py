@@ -0,0 +1,52 @@
+from galaxy.core.fingerprints import EntityFingerprints
+
+
+def test_entity_fingerprint_ignores_key_order():
+    entity = {"id": "1", "blueprintId": "repo", "properties": {"a": 1, "b": 2}}
+    reordered = {"properties": {"b": 2, "a": 1}, "blueprintId": "repo", "id": "1"}
+
+    assert EntityFingerprints.fingerprint(entity) == EntityFingerprints.fingerprint(reordered)
+    assert EntityFingerprints.fingerprint(entity) != EntityFingerprints.fingerprint({**entity, "title": "x"})
+
+
+def test_entity_fingerprints_filter_changed(tmp_path):
+    path = tmp_path / "fingerprints.db"
+    entities = [
+        {"id": "1", "blueprintId": "repo", "title": "one"},
+        {"id": "2", "blueprintId": "repo", "title": "two"},
+        {"id": "1", "blueprintId": "team", "title": "one"},
+    ]
+
+    with EntityFingerprints(path, integration_id="github") as fingerprints:
+        assert fingerprints.filter_changed(entities) == entities
+        fingerprints.record(entities[:2])
+
+    # Fingerprints are persisted across runs
+    with EntityFingerprints(path, integration_id="github") as fingerprints:
+        changed = {**entities[1], "title": "changed"}
+        no_key = {"title": "no id"}
+        assert fingerprints.filter_changed([entities[0], changed, entities[2], no_key]) == [
+            changed,
+            entities[2],
+            no_key,
+        ]
+
+    # Fingerprints are scoped by integration
+    with EntityFingerprints(path, integration_id="gitlab") as fingerprints:
+        assert fingerprints.filter_changed(entities) == entities
+
+
+def test_entity_fingerprints_expire(tmp_path, mocker):
+    path = tmp_path / "fingerprints.db"
+    entities = [{"id": "1", "blueprintId": "repo", "title": "one"}]
+
+    with EntityFingerprints(path, integration_id="github", max_age=60) as fingerprints:
+        mocker.patch("galaxy.core.fingerprints.time.time", return_value=1000)
+        fingerprints.record(entities)
+
+        mocker.patch("galaxy.core.fingerprints.time.time", return_value=1059)
+        assert fingerprints.filter_changed(entities) == []
+
+        # Entities are pushed again once their fingerprint expired, even if they did not change
+        mocker.patch("galaxy.core.fingerprints.time.time", return_value=1061)
+        assert fingerprints.filter_changed(entities) == entities
@@ -1,7 +1,18 @@
 import pytest
 import logging
+import time
+from unittest.mock import AsyncMock, MagicMock
 
-from galaxy.core.galaxy import Integration, register
+from galaxy.core import galaxy
+from galaxy.core.galaxy import (
+    Integration,
+    _next_push_task_poll_delay,
+    _run_integration_method_to_entities,
+    _wait_for_push_tasks_to_finish,
+    register,
+    run_integration_methods,
+)
+from galaxy.core.magneto import magneto_models
 from galaxy.core.models import Config
 
 
@@ -50,5 +61,162 @@ async def test_register_decorator(config):
     assert test_instance._methods[1][1] == 2
 
 
+async def streaming_method(self, *args, **kwargs):
+    for batch in range(3):
+        yield [{"id": f"{batch}-{i}", "name": "test"} for i in range(2)]
+
+
+@pytest.fixture
+def streaming_instance(config):
+    # Integration running a single method yielding its entities in batches
+    test_instance = IntegrationTest(Config(**config))
+    test_instance._methods = [(streaming_method, 1)]
+    return test_instance
+
+
+@pytest.mark.asyncio
+async def test_run_integration_method_to_entities_async_generator(streaming_instance):
+    method, _ = streaming_instance._methods[0]
+
+    entities = [e async for e in _run_integration_method_to_entities(instance=streaming_instance, method=method)]
+    assert [e["id"] for e in entities] == ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"]
+
+
+@pytest.mark.asyncio
+async def test_run_integration_methods_pushes_entities_in_chunks(streaming_instance, logger, mocker):
+    mocker.patch("galaxy.core.galaxy._update_integration_config_entity")
+    streaming_instance.config.integration.wait_for_tasks_enabled = False
+
+    magneto_client = MagicMock()
+    magneto_client.BULK_CHUNK_SIZE = 4
+    magneto_client.upsert_entities_bulk_chunks = AsyncMock(
+        side_effect=lambda entities: [(MagicMock(id=str(i)), [entity]) for i, entity in enumerate(entities)]
+    )
+
+    await run_integration_methods(
+        instance=streaming_instance, config_entity={}, magneto_client=magneto_client, logger=logger
+    )
+
+    pushed_chunks = [call.args[0] for call in magneto_client.upsert_entities_bulk_chunks.call_args_list]
+    assert [len(chunk) for chunk in pushed_chunks] == [4, 2]
+
+
+@pytest.mark.asyncio
+async def test_run_integration_methods_retries_failed_push_tasks(streaming_instance, logger, mocker):
+    mocker.patch("galaxy.core.galaxy._update_integration_config_entity")
+    mocker.patch("galaxy.core.galaxy.PUSH_TASKS_POLL_MIN_INTERVAL", 0)
+
+    magneto_client = MagicMock()
+    magneto_client.BULK_CHUNK_SIZE = 4
+    magneto_client.upsert_entities_bulk_chunks = AsyncMock(
+        side_effect=lambda entities, **kwargs: [(MagicMock(id=entities[0]["id"]), entities)]
+    )
+
+    failed_task_ids = {"0-0"}
+
+    async def get_tasks(task_ids):
+        for task_id in task_ids:
+            # The first chunk fails and succeeds once retried
+            if task_id in failed_task_ids:
+                failed_task_ids.remove(task_id)
+                yield MagicMock(id=task_id, status=magneto_models.TaskStatus.FAILED)
+            else:
+                yield MagicMock(id=task_id, status=magneto_models.TaskStatus.SUCCESS)
+
+    magneto_client.get_tasks = get_tasks
+    entity_fingerprints = MagicMock()
+    entity_fingerprints.filter_changed.side_effect = lambda entities: entities
+
+    await run_integration_methods(
+        instance=streaming_instance,
+        config_entity={},
+        magneto_client=magneto_client,
+        logger=logger,
+        entity_fingerprints=entity_fingerprints,
+    )
+
+    retried_entities = magneto_client.upsert_entities_bulk_chunks.call_args_list[-1].args[0]
+    assert [entity["id"] for entity in retried_entities] == ["0-0", "0-1", "1-0", "1-1"]
+    recorded_entities = list(entity_fingerprints.record.call_args.args[0])
+    assert sorted(entity["id"] for entity in recorded_entities) == ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"]
+
+
+def test_next_push_task_poll_delay(mocker):
+    mocker.patch("galaxy.core.galaxy.PUSH_TASKS_POLL_MIN_INTERVAL", 1)
+    mocker.patch("galaxy.core.galaxy.PUSH_TASKS_POLL_MAX_INTERVAL", 30)
+
+    # No reference of how long tasks take: back off based on the time already waited
+    assert _next_push_task_poll_delay(0, []) == 1
+    assert _next_push_task_poll_delay(10, []) == 5
+    assert _next_push_task_poll_delay(600, []) == 30
+    # Poll when the task is expected to finish
+    assert _next_push_task_poll_delay(2, [8, 10, 12]) == 8
+    # Task is taking longer than usual
+    assert _next_push_task_poll_delay(20, [8, 10, 12]) == 10
+
+
+@pytest.mark.asyncio
+async def test_wait_for_push_tasks_to_finish(logger, mocker):
+    mocker.patch("galaxy.core.galaxy.PUSH_TASKS_POLL_MIN_INTERVAL", 0)
+    mocker.patch("galaxy.core.galaxy.PUSH_TASKS_POLL_MAX_INTERVAL", 0)
+
+    statuses = {
+        "1": [magneto_models.TaskStatus.SUCCESS],
+        "2": [magneto_models.TaskStatus.RUNNING, magneto_models.TaskStatus.FAILED],
+        "3": [magneto_models.TaskStatus.CREATED, magneto_models.TaskStatus.RUNNING, magneto_models.TaskStatus.SUCCESS],
+    }
+    polled_task_ids = []
+
+    async def get_tasks(task_ids):
+        polled_task_ids.append(sorted(task_ids))
+        for task_id in task_ids:
+            yield MagicMock(id=task_id, status=statuses[task_id].pop(0))
+
+    magneto_client = MagicMock()
+    magneto_client.get_tasks = get_tasks
+
+    entities_tasks = {task_id: (MagicMock(id=task_id), [{"id": task_id}]) for task_id in statuses}
+    tasks_success, tasks_failed = await _wait_for_push_tasks_to_finish(
+        entities_tasks=entities_tasks, magneto_client=magneto_client, logger=logger, timeout=10
+    )
+
+    assert sorted(tasks_success) == ["1", "3"]
+    assert sorted(tasks_failed) == ["2"]
+    assert polled_task_ids == [["1", "2", "3"], ["2", "3"], ["3"]]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_push_tasks_to_finish_measures_from_task_creation(logger, mocker):
+    mocker.patch("galaxy.core.galaxy.PUSH_TASKS_POLL_MIN_INTERVAL", 0)
+    mocker.patch("galaxy.core.galaxy.PUSH_TASKS_POLL_MAX_INTERVAL", 0)
+    next_poll_delay = mocker.spy(galaxy, "_next_push_task_poll_delay")
+
+    statuses = {
+        "1": [magneto_models.TaskStatus.SUCCESS],
+        "2": [magneto_models.TaskStatus.RUNNING, magneto_models.TaskStatus.SUCCESS],
+    }
+
+    async def get_tasks(task_ids):
+        for task_id in task_ids:
+            yield MagicMock(id=task_id, status=statuses[task_id].pop(0))
+
+    magneto_client = MagicMock()
+    magneto_client.get_tasks = get_tasks
+
+    entities_tasks = {task_id: (MagicMock(id=task_id), [{"id": task_id}]) for task_id in statuses}
+    created_at = time.monotonic() - 100
+    await _wait_for_push_tasks_to_finish(
+        entities_tasks=entities_tasks,
+        tasks_created_at={"1": created_at, "2": created_at},
+        magneto_client=magneto_client,
+        logger=logger,
+        timeout=10,
+    )
+
+    elapsed, durations = next_poll_delay.call_args_list[0].args
+    assert elapsed >= 100
+    assert durations[0] >= 100
+
+
 if __name__ == "__main__":
     pytest.main()
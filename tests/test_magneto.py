@@ -0,0 +1,84 @@
+import logging
+from http import HTTPStatus
+
+import pytest
+
+from galaxy.core.magneto import Magneto, MagnetoApiError
+
+
+@pytest.fixture
+def magneto_client():
+    return Magneto("http://testurl.com/api/v1", "test_token", logger=logging.getLogger("test_logger"))
+
+
+@pytest.mark.asyncio
+async def test_upsert_entities_bulk_chunks_concurrently(magneto_client, mocker):
+    mocker.patch.object(
+        magneto_client, "upsert_entities_bulk_task", side_effect=lambda entities, **_: mocker.MagicMock()
+    )
+    entities = [{"id": str(i)} for i in range(10)]
+
+    created_tasks = await magneto_client.upsert_entities_bulk_chunks(entities, chunk_size=3, max_concurrency=2)
+
+    assert len(created_tasks) == 4
+    assert sorted(entity["id"] for _, chunk in created_tasks for entity in chunk) == sorted(e["id"] for e in entities)
+
+
+@pytest.mark.asyncio
+async def test_upsert_entities_bulk_chunks_splits_too_large_chunks(magneto_client, mocker):
+    async def upsert_entities_bulk_task(entities, **_):
+        if len(entities) > 2:
+            raise MagnetoApiError(status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        return mocker.MagicMock()
+
+    mocker.patch.object(magneto_client, "upsert_entities_bulk_task", side_effect=upsert_entities_bulk_task)
+    entities = [{"id": str(i)} for i in range(8)]
+
+    created_tasks = await magneto_client.upsert_entities_bulk_chunks(entities, chunk_size=8, max_concurrency=4)
+
+    assert [len(chunk) for _, chunk in created_tasks] == [2, 2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_upsert_entities_bulk_chunks_raises_unexpected_errors(magneto_client, mocker):
+    mocker.patch.object(
+        magneto_client,
+        "upsert_entities_bulk_task",
+        side_effect=MagnetoApiError(status_code=HTTPStatus.INTERNAL_SERVER_ERROR),
+    )
+
+    with pytest.raises(MagnetoApiError):
+        await magneto_client.upsert_entities_bulk_chunks([{"id": "1"}, {"id": "2"}], chunk_size=1, max_concurrency=2)
+
+
+@pytest.mark.asyncio
+async def test_upsert_entities_bulk_chunks_packs_chunks_by_size(magneto_client, mocker):
+    mocker.patch.object(
+        magneto_client, "upsert_entities_bulk_task", side_effect=lambda entities, **_: mocker.MagicMock()
+    )
+    magneto_client.bulk_chunk_max_bytes = 250
+    entities = [{"id": str(i), "readme": "x" * 100} for i in range(5)]
+
+    created_tasks = await magneto_client.upsert_entities_bulk_chunks(entities, chunk_size=100, max_concurrency=1)
+
+    assert [len(chunk) for _, chunk in created_tasks] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_upsert_entities_bulk_chunks_learns_max_bytes(magneto_client, mocker):
+    async def upsert_entities_bulk_task(entities, **_):
+        if len(entities) > 2:
+            raise MagnetoApiError(status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        return mocker.MagicMock()
+
+    mocker.patch.object(magneto_client, "upsert_entities_bulk_task", side_effect=upsert_entities_bulk_task)
+    entities = [{"id": str(i), "readme": "x" * 100} for i in range(8)]
+
+    await magneto_client.upsert_entities_bulk_chunks(entities, chunk_size=8, max_concurrency=1)
+    assert magneto_client.bulk_chunk_max_bytes < magneto_client.BULK_CHUNK_MAX_BYTES
+
+    # Following pushes are packed within the learned limit without being rejected
+    magneto_client.upsert_entities_bulk_task.reset_mock()
+    created_tasks = await magneto_client.upsert_entities_bulk_chunks(entities, chunk_size=8, max_concurrency=1)
+    assert [len(chunk) for _, chunk in created_tasks] == [2, 2, 2, 2]
+    assert magneto_client.upsert_entities_bulk_task.call_count == 4
@@ -1,8 +1,10 @@
+import copy
+import logging
 from unittest.mock import patch
 
 import pytest
 
-from galaxy.core.mapper import Mapper
+from galaxy.core.mapper import Mapper, MapperCompilationError
 
 
 @pytest.fixture
@@ -36,3 +38,95 @@ async def test_process(mock_resource_filename, mock_load_integration_resource):
     entities = await mapper.process("test_kind", json_data)
     assert entities == expected_entities
     mock_load_integration_resource.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_process_batch_with_context():
+    mock_values = """
+    resources:
+      - kind: test_kind
+        mappings:
+          id: .context.prefix + "-" + (.number | tostring)
+          title: .title
+          blueprintId: '"test.blueprint"'
+          priority: 1
+          properties:
+            labels: .labels[]
+    """
+    json_data = [{"number": 1, "title": "one", "labels": ["a", "b"]}, {"number": 2, "title": "two", "labels": ["c"]}]
+    expected_entities = [
+        {"id": "repo-1", "title": "one", "blueprintId": "test.blueprint", "priority": 1, "properties": {"labels": "a"}},
+        {"id": "repo-2", "title": "two", "blueprintId": "test.blueprint", "priority": 1, "properties": {"labels": "c"}},
+    ]
+
+    with patch("galaxy.core.mapper.load_integration_resource", return_value=mock_values):
+        mapper = Mapper("test_integration")
+        entities = await mapper.process("test_kind", json_data, context={"prefix": "Repo"})
+
+    assert entities == expected_entities
+    assert mapper.get_compiled_program("test_kind") is not None
+
+
+@pytest.mark.asyncio
+async def test_process_batch_reports_field_errors(caplog):
+    mock_values = """
+    resources:
+      - kind: test_kind
+        mappings:
+          id: .id
+          title: .labels[]
+    """
+    json_data = [{"id": "1", "labels": ["a"]}, {"id": "2", "labels": []}]
+
+    with patch("galaxy.core.mapper.load_integration_resource", return_value=mock_values):
+        mapper = Mapper("test_integration")
+        with (
+            caplog.at_level(logging.DEBUG, logger="galaxy"),
+            pytest.raises(Exception, match=r"Error mapping with expression .*\.labels\[\]"),
+        ):
+            await mapper.process("test_kind", json_data)
+
+    assert "Mapped 1 entities of kind test_kind from 2 items, mapping each field separately" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_process_in_worker_processes(mocker, mock_load_integration_resource):
+    async def run_in_process(func, *args):
+        return func(*args)
+
+    run_in_process_mock = mocker.patch("galaxy.core.mapper.run_in_process", side_effect=run_in_process)
+    mocker.patch("galaxy.core.mapper.set_process_pool_limit")
+    json_data = [{"data1": f"value{i}", "data2": "value2", "data3": "value3"} for i in range(5)]
+
+    mapper = Mapper("test_integration", processes=2, process_threshold=5)
+    entities = await mapper.process("test_kind", json_data)
+
+    assert [entity["key1"] for entity in entities] == [f"value{i}" for i in range(5)]
+    assert run_in_process_mock.call_count == 2
+
+    # Lists below the threshold are mapped in a thread
+    await mapper.process("test_kind", json_data[:4])
+    assert run_in_process_mock.call_count == 2
+
+
+def test_compiled_mappings_are_shared(mock_load_integration_resource):
+    mapper = Mapper("test_integration")
+    mapper.compile_all_mappings()
+
+    other_mapper = Mapper("test_integration")
+    assert other_mapper.get_compiled_mappings("test_kind") is mapper.get_compiled_mappings("test_kind")
+    assert copy.deepcopy(mapper).get_compiled_program("test_kind") is mapper.get_compiled_program("test_kind")
+    assert mock_load_integration_resource.call_count == 2
+
+
+def test_compile_all_mappings_error():
+    mock_values = """
+    resources:
+      - kind: test_kind
+        mappings:
+          id: .id |||
+    """
+    with patch("galaxy.core.mapper.load_integration_resource", return_value=mock_values):
+        mapper = Mapper("test_integration")
+        with pytest.raises(MapperCompilationError, match="test_kind"):
+            mapper.compile_all_mappings()
@@ -71,6 +71,21 @@ def test_integration_config():
     assert config.default_model_mappings == data["defaultModelMappings"]
     assert config.dry_run == data["dryRun"]
     assert config.properties == data["properties"]
+    assert config.push_tasks_max_concurrency == 5
+
+
+def test_integration_config_invalid_push_tasks_max_concurrency():
+    data = {
+        "id": "integration_id",
+        "type": "integration_type",
+        "executionType": "daemon",
+        "scheduledInterval": 30,
+        "defaultModelMappings": {},
+        "properties": {},
+        "pushTasksMaxConcurrency": 0,
+    }
+    with pytest.raises(ValidationError):
+        IntegrationConfig(**data)
 
 
 def test_config_from_yaml(valid_yaml, mocker):
@@ -0,0 +1,53 @@
+import anyio
+import pytest
+
+from galaxy.utils.pagination import fetch_pages, fetch_pages_until
+
+
+async def test_fetch_pages_keeps_order_and_limits_concurrency():
+    in_flight = max_in_flight = 0
+
+    async def fetch_page(page: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await anyio.sleep(0.01 * (10 - page))
+        in_flight -= 1
+        return page
+
+    assert await fetch_pages(fetch_page, range(2, 10), max_concurrency=3) == list(range(2, 10))
+    assert max_in_flight == 3
+
+
+async def test_fetch_pages_raises_the_error_of_a_page():
+    async def fetch_page(page: int) -> int:
+        if page == 3:
+            raise ValueError("page 3")
+        return page
+
+    with pytest.raises(ValueError, match="page 3"):
+        await fetch_pages(fetch_page, range(1, 5), max_concurrency=2)
+
+
+async def test_fetch_pages_until_discards_the_pages_after_the_last_one():
+    requested = []
+
+    async def fetch_page(page: int) -> list[int]:
+        requested.append(page)
+        return [page] * (2 if page < 4 else 1 if page == 4 else 0)
+
+    pages = await fetch_pages_until(fetch_page, lambda items: len(items) < 2, first_page=0, max_concurrency=3)
+
+    assert pages == [[0, 0], [1, 1], [2, 2], [3, 3], [4]]
+    assert sorted(requested) == list(range(7))
+
+
+async def test_fetch_pages_until_fetches_a_single_last_page_alone():
+    requested = []
+
+    async def fetch_page(page: int) -> list[int]:
+        requested.append(page)
+        return [page]
+
+    assert await fetch_pages_until(fetch_page, lambda items: len(items) < 2, max_concurrency=5) == [[1]]
+    assert requested == [1]
@@ -0,0 +1,97 @@
+import time
+
+import anyio
+import pytest
+from aiohttp import web
+from multidict import CIMultiDict
+
+from galaxy.utils.requests import (
+    ConnectionPolicy,
+    RateLimiter,
+    RateLimitError,
+    RetryPolicy,
+    create_session,
+    make_request,
+)
+
+
+def test_connection_policy_from_properties():
+    policy = ConnectionPolicy.from_properties(
+        {"httpMaxConnectionsPerHost": "5", "httpMaxRequestsPerHost": 2, "httpKeepaliveTimeout": ""}
+    )
+
+    assert policy.max_connections_per_host == 5
+    assert policy.max_requests_per_host == 2
+    assert policy.keepalive_timeout == ConnectionPolicy().keepalive_timeout
+
+
+async def test_create_session_limits_requests_per_host():
+    in_flight = max_in_flight = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await anyio.sleep(0.05)
+        in_flight -= 1
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        async with (
+            create_session(connection_policy=ConnectionPolicy(max_requests_per_host=2)) as session,
+            anyio.create_task_group() as task_group,
+        ):
+            for _ in range(6):
+                task_group.start_soon(make_request, session, "GET", f"http://127.0.0.1:{port}/")
+    finally:
+        await runner.cleanup()
+
+    assert max_in_flight == 2
+
+
+def test_rate_limiter_waits_until_reset_when_exhausted():
+    limiter = RateLimiter()
+    reset = time.time() + 30
+    limiter.update(
+        CIMultiDict({"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+    )
+
+    assert limiter.delay() == pytest.approx(30, abs=1)
+
+
+def test_rate_limiter_spreads_requests_when_running_low():
+    limiter = RateLimiter()
+    limiter.update(CIMultiDict({"RateLimit-Limit": "100", "RateLimit-Remaining": "5", "RateLimit-Reset": "10"}))
+
+    delays = [limiter.delay() for _ in range(3)]
+    assert delays[0] == pytest.approx(0, abs=0.1)
+    assert delays[1] == pytest.approx(2, abs=0.1)
+    assert delays[2] == pytest.approx(2 + 8 / 4, abs=0.1)
+    assert limiter.remaining == 2
+
+
+def test_rate_limiter_retry_after():
+    limiter = RateLimiter()
+    limiter.update(CIMultiDict({"Retry-After": "12"}))
+
+    assert limiter.delay() == pytest.approx(12, abs=1)
+    assert RateLimiter().delay() == 0
+
+
+def test_retry_policy_does_not_wait_when_rate_limit_reset_is_known(mocker):
+    policy = RetryPolicy()
+    error = RateLimitError(message="", response_content=None, method="GET", url="", headers={"Retry-After": "1"})
+    retry_state = mocker.MagicMock(attempt_number=1)
+    retry_state.outcome.exception.return_value = error
+    assert policy._wait(retry_state) == 0
+
+    error.headers = {}
+    assert 0 <= policy._wait(retry_state) <= policy.wait_max